@@ -9,11 +9,20 @@ Production mapping:
 For this project: Console logging with simulation
 """
 
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 
 
+# Pre-built banner separator shared by every formatted alert
+_SEP = "=" * 60
+
+
 class AlertType(Enum):
     """Alert type enumeration."""
     PRICE_DROP = "price_drop"
@@ -33,15 +42,111 @@ class AlertNotifier:
     - SMS via Twilio
     """
 
-    def __init__(self, enabled: bool = True):
+    def __init__(
+        self,
+        enabled: bool = True,
+        async_dispatch: bool = False,
+        max_history: int = 10_000,
+        cooldown_seconds: float = 300.0,
+    ):
         """
         Initialize alert notifier.
 
         Args:
             enabled: Whether alerts are enabled
+            async_dispatch: Log alerts from a background worker thread so
+                send_alert returns without blocking on I/O
+            max_history: Maximum alerts to retain; oldest are evicted first
+            cooldown_seconds: Suppress repeat alerts with the same
+                (type, gpu_model, provider) fingerprint within this window;
+                0 disables de-duplication
         """
         self.enabled = enabled
-        self.alert_history: List[Dict[str, Any]] = []
+        # Pre-allocated ring buffer keeps memory constant in long-running
+        # services: recording an alert is one slot store plus a cursor
+        # bump, with no per-append allocation or eviction work
+        self._max_history = max_history
+        self._ring: List[Optional[Dict[str, Any]]] = [None] * max_history
+        self._cursor = 0
+        self._count = 0
+        # Admission filter: last-emitted time per alert fingerprint, LRU-bounded
+        self.cooldown_seconds = cooldown_seconds
+        self._recent: "OrderedDict[tuple, float]" = OrderedDict()
+        self._max_recent = 4096
+        self.async_dispatch = async_dispatch
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+
+        if async_dispatch:
+            self._queue = queue.Queue(maxsize=1024)
+            self._worker = threading.Thread(target=self._drain_queue, daemon=True)
+            self._worker.start()
+
+    def _drain_queue(self) -> None:
+        """Worker loop: pull queued alerts and log them in batches."""
+        while True:
+            alert = self._queue.get()
+            if alert is None:  # Shutdown sentinel
+                break
+
+            # Drain whatever else is already queued (up to 64 per batch) so
+            # bursts are emitted with one buffered write
+            batch = [alert]
+            while len(batch) < 64:
+                try:
+                    extra = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    sys.stdout.write(''.join(self._format_alert(a) for a in batch))
+                    return
+                batch.append(extra)
+
+            sys.stdout.write(''.join(self._format_alert(a) for a in batch))
+
+    def close(self) -> None:
+        """Flush and stop the background dispatch worker (if running)."""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    @property
+    def alert_history(self) -> List[Dict[str, Any]]:
+        """Retained alerts, oldest first."""
+        return self.get_alert_history(limit=self._count)
+
+    def _record(self, alert: Dict[str, Any]) -> None:
+        """Store an alert in the ring buffer, overwriting the oldest slot."""
+        self._ring[self._cursor] = alert
+        self._cursor = (self._cursor + 1) % self._max_history
+        self._count = min(self._count + 1, self._max_history)
+
+    def _admit(self, alert_type: AlertType, data: Optional[Dict[str, Any]]) -> bool:
+        """
+        Decide whether an alert passes the de-duplication filter.
+
+        Alerts sharing a (type, gpu_model, provider) fingerprint are
+        suppressed for cooldown_seconds after the last emitted one, which
+        drops the redundant repeats produced by periodic scans.
+        """
+        if self.cooldown_seconds <= 0:
+            return True
+
+        data = data or {}
+        fingerprint = (alert_type.value, data.get('gpu_model'), data.get('provider'))
+        now = time.monotonic()
+
+        last_sent = self._recent.get(fingerprint)
+        if last_sent is not None and now - last_sent < self.cooldown_seconds:
+            return False
+
+        self._recent[fingerprint] = now
+        self._recent.move_to_end(fingerprint)
+        if len(self._recent) > self._max_recent:
+            self._recent.popitem(last=False)
+
+        return True
 
     def send_alert(
         self,
@@ -65,6 +170,9 @@ class AlertNotifier:
         if not self.enabled:
             return False
 
+        if not self._admit(alert_type, data):
+            return False
+
         alert = {
             'type': alert_type.value,
             'title': title,
@@ -73,24 +181,77 @@ class AlertNotifier:
             'timestamp': datetime.utcnow().isoformat() + 'Z',
         }
 
-        self.alert_history.append(alert)
+        self._record(alert)
+
+        if self._queue is not None:
+            # Fire-and-forget: the worker thread handles formatting and I/O.
+            # Drop on overflow rather than blocking the producer.
+            try:
+                self._queue.put_nowait(alert)
+            except queue.Full:
+                pass
+            return True
 
         # Simulate notification (in production, this would call SNS/email/etc.)
         self._log_alert(alert)
 
         return True
 
+    def send_alerts_batch(self, alerts: List[Dict[str, Any]]) -> int:
+        """
+        Send multiple alerts in one batch.
+
+        Appends all alerts to history with a single extend and emits one
+        buffered write, mirroring the SNS PublishBatch pattern - per-alert
+        formatting and I/O overhead is amortized across the batch.
+
+        Args:
+            alerts: List of dicts with 'alert_type' (AlertType), 'title',
+                'message', and optional 'data' keys
+
+        Returns:
+            Number of alerts sent
+        """
+        if not self.enabled or not alerts:
+            return 0
+
+        timestamp = datetime.utcnow().isoformat() + 'Z'
+        entries = [
+            {
+                'type': a['alert_type'].value,
+                'title': a['title'],
+                'message': a['message'],
+                'data': a.get('data') or {},
+                'timestamp': timestamp,
+            }
+            for a in alerts
+        ]
+
+        for entry in entries:
+            self._record(entry)
+
+        # Single buffered write instead of one print per alert
+        sys.stdout.write(''.join(self._format_alert(e) for e in entries))
+
+        return len(entries)
+
+    def _format_alert(self, alert: Dict[str, Any]) -> str:
+        """Format an alert into its console banner string."""
+        data_line = f"Data: {alert['data']}\n" if alert['data'] else ""
+        return (
+            f"\n{_SEP}\n"
+            f"🔔 ALERT: {alert['type'].upper()}\n"
+            f"{_SEP}\n"
+            f"Title: {alert['title']}\n"
+            f"Message: {alert['message']}\n"
+            f"Time: {alert['timestamp']}\n"
+            f"{data_line}"
+            f"{_SEP}\n\n"
+        )
+
     def _log_alert(self, alert: Dict[str, Any]) -> None:
         """Log alert to console (simulates sending notification)."""
-        print("\n" + "="*60)
-        print(f"🔔 ALERT: {alert['type'].upper()}")
-        print("="*60)
-        print(f"Title: {alert['title']}")
-        print(f"Message: {alert['message']}")
-        print(f"Time: {alert['timestamp']}")
-        if alert['data']:
-            print(f"Data: {alert['data']}")
-        print("="*60 + "\n")
+        sys.stdout.write(self._format_alert(alert))
 
         # In production, this would be:
         # import boto3
@@ -227,11 +388,15 @@ class AlertNotifier:
         Returns:
             List of recent alerts
         """
-        return self.alert_history[-limit:]
+        n = min(limit, self._count)
+        start = (self._cursor - n) % self._max_history
+        return [self._ring[(start + i) % self._max_history] for i in range(n)]
 
     def clear_history(self) -> None:
         """Clear alert history."""
-        self.alert_history.clear()
+        self._ring = [None] * self._max_history
+        self._cursor = 0
+        self._count = 0
 
 
 # Global notifier instance
@@ -8,10 +8,61 @@ When the same GPU (or equivalent performance) is available at
 significantly different prices across providers.
 """
 
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+import heapq
+import sys
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analytics.table import PriceTable
 from normalization.normalize import normalize_prices
 
+try:
+    import numba
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+# Pre-built separators for report formatting
+_SEP = "=" * 70
+_RULE = "─" * 70
+
+
+def _group_minmax(price, code, n_groups):
+    """
+    Single-pass grouped min/max reduction over categorical codes.
+
+    Returns (min_idx, max_idx, count) arrays indexed by group code; idx
+    entries are positions into `price` (-1 for empty groups). Compiled
+    with Numba when available - the loop then runs as native code and
+    replaces the pandas groupby in the detection hot path.
+    """
+    min_val = np.full(n_groups, np.inf, np.float64)
+    max_val = np.full(n_groups, -np.inf, np.float64)
+    min_idx = np.full(n_groups, -1, np.int64)
+    max_idx = np.full(n_groups, -1, np.int64)
+    count = np.zeros(n_groups, np.int64)
+
+    for i in range(price.size):
+        g = code[i]
+        v = price[i]
+        if v < min_val[g]:
+            min_val[g] = v
+            min_idx[g] = i
+        if v > max_val[g]:
+            max_val[g] = v
+            max_idx[g] = i
+        count[g] += 1
+
+    return min_idx, max_idx, count
+
+
+if _HAVE_NUMBA:
+    _group_minmax = numba.njit(cache=True, fastmath=True)(_group_minmax)
+
 
 class ArbitrageOpportunity:
     """Represents a single arbitrage opportunity."""
@@ -32,6 +83,11 @@ class ArbitrageOpportunity:
         self.percentage_savings = percentage_savings
         self.all_providers = all_providers
 
+    @property
+    def providers_by_price(self) -> List[Dict[str, Any]]:
+        """All providers sorted by price (cheapest first), computed on demand."""
+        return sorted(self.all_providers, key=itemgetter('price_per_hour'))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -83,6 +139,15 @@ class ArbitrageDetector:
         self.min_price_difference = min_price_difference
         self.min_percentage_savings = min_percentage_savings
         self.min_providers = min_providers
+        # Memoized detection results, keyed by (id, len, precision) of the
+        # input list - avoids re-normalizing when callers scan many GPU models
+        # against the same price batch
+        self._detection_cache: Dict[Any, List[ArbitrageOpportunity]] = {}
+        self._cache_max_entries = 8
+
+    def invalidate_cache(self) -> None:
+        """Clear memoized detection results (call after prices change in place)."""
+        self._detection_cache.clear()
 
     def detect_opportunities(
         self,
@@ -92,6 +157,10 @@ class ArbitrageDetector:
         """
         Detect all arbitrage opportunities in the given prices.
 
+        Results are memoized per input batch, so repeated scans over the
+        same price list (e.g. a dashboard querying GPU by GPU) only pay
+        for normalization and grouping once.
+
         Args:
             prices: List of price dictionaries
             precision: Precision to use for normalization
@@ -99,53 +168,163 @@ class ArbitrageDetector:
         Returns:
             List of arbitrage opportunities, sorted by savings
         """
-        # Normalize prices
-        normalized = normalize_prices(prices, precision=precision)
+        cache_key = (id(prices), len(prices), precision)
+        cached = self._detection_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Group by GPU model
-        by_gpu = defaultdict(list)
-        for price in normalized:
-            gpu_model = price.get('gpu_model')
-            if gpu_model and price.get('normalized'):
-                by_gpu[gpu_model].append(price)
+        opportunities = self._detect(prices, precision)
 
-        # Find arbitrage opportunities
-        opportunities = []
+        # Sort by percentage savings (descending)
+        opportunities.sort(key=attrgetter('percentage_savings'), reverse=True)
 
-        for gpu_model, gpu_prices in by_gpu.items():
-            # Need at least min_providers to have an opportunity
-            if len(gpu_prices) < self.min_providers:
-                continue
-
-            # Sort by price
-            sorted_prices = sorted(gpu_prices, key=lambda x: x['price_per_hour'])
-
-            cheapest = sorted_prices[0]
-            most_expensive = sorted_prices[-1]
-
-            price_diff = most_expensive['price_per_hour'] - cheapest['price_per_hour']
-            percentage_savings = (price_diff / most_expensive['price_per_hour']) * 100
-
-            # Check if it meets thresholds
-            if (
-                price_diff >= self.min_price_difference and
-                percentage_savings >= self.min_percentage_savings
-            ):
-                opportunity = ArbitrageOpportunity(
-                    gpu_model=gpu_model,
-                    cheapest_provider=cheapest,
-                    most_expensive_provider=most_expensive,
-                    price_difference=price_diff,
-                    percentage_savings=percentage_savings,
-                    all_providers=sorted_prices,
-                )
-                opportunities.append(opportunity)
+        if len(self._detection_cache) >= self._cache_max_entries:
+            # Evict oldest entry (dicts preserve insertion order)
+            self._detection_cache.pop(next(iter(self._detection_cache)))
+        self._detection_cache[cache_key] = opportunities
 
-        # Sort by percentage savings (descending)
-        opportunities.sort(key=lambda x: x.percentage_savings, reverse=True)
+        return opportunities
+
+    def _detect(
+        self,
+        prices: Any,
+        precision: str,
+    ) -> List[ArbitrageOpportunity]:
+        """Run the full normalization and group-and-reduce detection pass."""
+        # Accept either raw price dicts or a pre-built columnar PriceTable
+        table = prices if isinstance(prices, PriceTable) else PriceTable.from_dicts(prices)
+
+        # Normalize prices (annotates the row dicts in place)
+        normalized = normalize_prices(table.rows, precision=precision)
+
+        if not normalized:
+            return []
+
+        # Assemble the frame straight from the SoA columns - grouping and the
+        # min/max reductions then run in C over contiguous arrays instead of
+        # per-dict Python loops
+        norm_flags = np.fromiter(
+            (bool(r.get('normalized')) for r in table.rows),
+            dtype=bool,
+            count=len(table),
+        )
+        valid = norm_flags & (table.gpu_model.codes >= 0)
+
+        if not valid.any():
+            return []
+
+        codes_all = np.asarray(table.gpu_model.codes, dtype=np.int64)
+        prices_all = table.price_per_hour.astype(np.float64)
+
+        # Vectorized group-and-reduce: one pass finds each GPU's cheapest and
+        # most expensive offer plus the provider count
+        if _HAVE_NUMBA:
+            # JITted single-loop kernel over categorical codes
+            valid_idx = np.flatnonzero(valid)
+            min_idx, max_idx, group_counts = _group_minmax(
+                prices_all[valid_idx],
+                codes_all[valid_idx],
+                len(table.gpu_model.categories),
+            )
+            present = np.flatnonzero(group_counts > 0)
+            group_names = table.gpu_model.categories.to_numpy()[present]
+            counts_arr = group_counts[present]
+            min_rows = valid_idx[min_idx[present]]
+            max_rows = valid_idx[max_idx[present]]
+
+            def member_rows(pos):
+                return valid_idx[codes_all[valid_idx] == present[pos]]
+        else:
+            df = pd.DataFrame({
+                'gpu_model': table.gpu_model,
+                'price_per_hour': prices_all,
+            })
+            df = df[valid]
+
+            # gpu_model is Categorical (from PriceTable); observed=True
+            # keeps rows dropped by the valid filter (e.g. unknown
+            # models) from surfacing as empty groups, which would make
+            # idxmin raise on pandas 2.x
+            grouped = df.groupby('gpu_model', sort=False, observed=True)['price_per_hour']
+            counts = grouped.size()
+            group_names = counts.index.to_numpy()
+            counts_arr = counts.to_numpy()
+            min_rows = grouped.idxmin().to_numpy()
+            max_rows = grouped.idxmax().to_numpy()
+
+            group_indices = df.groupby('gpu_model', sort=False, observed=True).indices
+            df_index = df.index.to_numpy()
+
+            def member_rows(pos):
+                return df_index[group_indices[group_names[pos]]]
+
+        min_prices = prices_all[min_rows]
+        max_prices = prices_all[max_rows]
+
+        price_diffs = max_prices - min_prices
+
+        # Hoist thresholds to locals and apply the cheap filters first, so
+        # the savings division only runs for groups still in play
+        min_providers = self.min_providers
+        min_diff = self.min_price_difference
+        min_pct = self.min_percentage_savings
+
+        mask = (counts_arr >= min_providers) & (price_diffs >= min_diff)
+
+        percentage_savings = np.zeros_like(price_diffs)
+        np.divide(
+            price_diffs, max_prices,
+            out=percentage_savings,
+            where=mask & (max_prices > 0),
+        )
+        percentage_savings *= 100
+
+        mask &= percentage_savings >= min_pct
+
+        # Only materialize ArbitrageOpportunity objects for surviving rows
+        opportunities = []
+        for pos in np.flatnonzero(mask):
+            gpu_prices = [table.rows[i] for i in member_rows(pos)]
+
+            opportunities.append(ArbitrageOpportunity(
+                gpu_model=str(group_names[pos]),
+                cheapest_provider=table.rows[min_rows[pos]],
+                most_expensive_provider=table.rows[max_rows[pos]],
+                price_difference=float(price_diffs[pos]),
+                percentage_savings=float(percentage_savings[pos]),
+                all_providers=gpu_prices,
+            ))
 
         return opportunities
 
+    def detect_top_opportunities(
+        self,
+        prices: List[Dict[str, Any]],
+        k: int,
+        precision: str = "fp32",
+    ) -> List[ArbitrageOpportunity]:
+        """
+        Detect the top-k arbitrage opportunities by percentage savings.
+
+        Uses heapq.nlargest (O(M log k)) rather than a full sort when the
+        result is not already cached, which matters when callers only want
+        a handful of opportunities out of a large candidate set.
+
+        Args:
+            prices: List of price dictionaries
+            k: Number of opportunities to return
+            precision: Precision to use for normalization
+
+        Returns:
+            Top-k opportunities, best first
+        """
+        cached = self._detection_cache.get((id(prices), len(prices), precision))
+        if cached is not None:
+            return cached[:k]
+
+        candidates = self._detect(prices, precision)
+        return heapq.nlargest(k, candidates, key=attrgetter('percentage_savings'))
+
     def get_best_arbitrage(
         self,
         prices: List[Dict[str, Any]],
@@ -161,14 +340,15 @@ class ArbitrageDetector:
         Returns:
             Best opportunity or None
         """
-        opportunities = self.detect_opportunities(prices, precision)
-        return opportunities[0] if opportunities else None
+        top = self.detect_top_opportunities(prices, 1, precision)
+        return top[0] if top else None
 
     def get_arbitrage_by_gpu(
         self,
         prices: List[Dict[str, Any]],
         gpu_model: str,
         precision: str = "fp32",
+        index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """
         Get arbitrage opportunity for a specific GPU model.
@@ -177,10 +357,16 @@ class ArbitrageDetector:
             prices: List of price dictionaries
             gpu_model: GPU model to analyze
             precision: Precision to use for normalization
+            index: Optional build_gpu_index(prices) result; detection
+                then runs on just that model's rows instead of the full
+                batch
 
         Returns:
             Arbitrage opportunity or None
         """
+        if index is not None:
+            prices = index.get(gpu_model, [])
+
         opportunities = self.detect_opportunities(prices, precision)
 
         for opp in opportunities:
@@ -189,11 +375,60 @@ class ArbitrageDetector:
 
         return None
 
+    def get_opportunities_by_gpu_batch(
+        self,
+        prices: List[Dict[str, Any]],
+        gpu_models: List[str],
+        precision: str = "fp32",
+    ) -> Dict[str, Optional[ArbitrageOpportunity]]:
+        """
+        Get arbitrage opportunities for several GPU models in one pass.
+
+        Runs detection once and indexes the results, instead of re-scanning
+        the full price list per model.
+
+        Args:
+            prices: List of price dictionaries
+            gpu_models: GPU models to look up
+            precision: Precision to use for normalization
+
+        Returns:
+            Mapping of gpu_model to its opportunity (or None)
+        """
+        opportunities = self.detect_opportunities(prices, precision)
+        by_gpu = {opp.gpu_model: opp for opp in opportunities}
+        return {model: by_gpu.get(model) for model in gpu_models}
+
+
+def build_provider_gpu_index(
+    prices: List[Dict[str, Any]],
+) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    Index price rows by (provider, gpu_model) in one O(N) pass.
+
+    Built once per snapshot and passed to find_cross_region_arbitrage,
+    it replaces a full-list filter per query with a dict probe.
+
+    Args:
+        prices: List of price dictionaries
+
+    Returns:
+        Mapping of (provider, gpu_model) to its price rows
+    """
+    index: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for price in prices:
+        provider = price.get('provider')
+        model = price.get('gpu_model')
+        if provider and model:
+            index.setdefault((provider, model), []).append(price)
+    return index
+
 
 def find_cross_region_arbitrage(
     prices: List[Dict[str, Any]],
     provider: str,
     gpu_model: str,
+    index: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Find arbitrage opportunities across regions for the same provider.
@@ -204,24 +439,27 @@ def find_cross_region_arbitrage(
         prices: List of price dictionaries
         provider: Provider name (e.g., "AWS")
         gpu_model: GPU model to analyze
+        index: Optional build_provider_gpu_index(prices) result; skips
+            the per-call filter pass
 
     Returns:
         Cross-region arbitrage info or None
     """
-    # Filter to specific provider and GPU
-    filtered = [
-        p for p in prices
-        if p.get('provider') == provider and p.get('gpu_model') == gpu_model
-    ]
+    # Filter to specific provider and GPU (one dict probe when indexed)
+    if index is not None:
+        filtered = index.get((provider, gpu_model), [])
+    else:
+        filtered = [
+            p for p in prices
+            if p.get('provider') == provider and p.get('gpu_model') == gpu_model
+        ]
 
     if len(filtered) < 2:
         return None
 
-    # Sort by price
-    sorted_prices = sorted(filtered, key=lambda x: x['price_per_hour'])
-
-    cheapest = sorted_prices[0]
-    most_expensive = sorted_prices[-1]
+    # Single pass min/max - only the extremes are needed, not a full sort
+    cheapest = min(filtered, key=itemgetter('price_per_hour'))
+    most_expensive = max(filtered, key=itemgetter('price_per_hour'))
 
     price_diff = most_expensive['price_per_hour'] - cheapest['price_per_hour']
 
@@ -266,6 +504,26 @@ def calculate_monthly_savings(opportunity: ArbitrageOpportunity) -> Dict[str, fl
     }
 
 
+def _format_opportunity(args: tuple) -> str:
+    """Format one opportunity into its report block (pure function)."""
+    idx, opp = args
+    savings = calculate_monthly_savings(opp)
+    return '\n'.join([
+        f"#{idx} - {opp.gpu_model}",
+        _RULE,
+        f"🏆 CHEAPEST:  {opp.cheapest['provider']:15} ({opp.cheapest['region']:15})",
+        f"              ${opp.cheapest['price_per_hour']:7.2f}/hour  |  {opp.cheapest['availability']:5.0%} availability",
+        f"\n💸 EXPENSIVE: {opp.most_expensive['provider']:15} ({opp.most_expensive['region']:15})",
+        f"              ${opp.most_expensive['price_per_hour']:7.2f}/hour  |  {opp.most_expensive['availability']:5.0%} availability",
+        f"\n💰 SAVINGS:   {opp.percentage_savings:.1f}% cheaper",
+        f"              ${savings['hourly_savings']:.2f}/hour",
+        f"              ${savings['monthly_savings']:,.2f}/month (24/7 usage)",
+        f"              ${savings['annual_savings']:,.2f}/year",
+        f"\n📊 PROVIDERS: {len(opp.all_providers)} offering this GPU",
+        f"{_SEP}\n",
+    ])
+
+
 def print_arbitrage_report(opportunities: List[ArbitrageOpportunity]) -> None:
     """
     Print a formatted arbitrage report.
@@ -277,25 +535,15 @@ def print_arbitrage_report(opportunities: List[ArbitrageOpportunity]) -> None:
         print("\n❌ No arbitrage opportunities found.\n")
         return
 
-    print(f"\n{'='*70}")
-    print(f"ARBITRAGE OPPORTUNITIES DETECTED: {len(opportunities)}")
-    print(f"{'='*70}\n")
-
-    for idx, opp in enumerate(opportunities, 1):
-        print(f"#{idx} - {opp.gpu_model}")
-        print(f"{'─'*70}")
-
-        print(f"🏆 CHEAPEST:  {opp.cheapest['provider']:15} ({opp.cheapest['region']:15})")
-        print(f"              ${opp.cheapest['price_per_hour']:7.2f}/hour  |  {opp.cheapest['availability']:5.0%} availability")
-
-        print(f"\n💸 EXPENSIVE: {opp.most_expensive['provider']:15} ({opp.most_expensive['region']:15})")
-        print(f"              ${opp.most_expensive['price_per_hour']:7.2f}/hour  |  {opp.most_expensive['availability']:5.0%} availability")
-
-        savings = calculate_monthly_savings(opp)
-        print(f"\n💰 SAVINGS:   {opp.percentage_savings:.1f}% cheaper")
-        print(f"              ${savings['hourly_savings']:.2f}/hour")
-        print(f"              ${savings['monthly_savings']:,.2f}/month (24/7 usage)")
-        print(f"              ${savings['annual_savings']:,.2f}/year")
-
-        print(f"\n📊 PROVIDERS: {len(opp.all_providers)} offering this GPU")
-        print(f"{'='*70}\n")
+    # Each opportunity block formats independently; for big reports fan the
+    # formatting out across threads, then emit everything with one write
+    numbered = list(enumerate(opportunities, 1))
+    if len(numbered) >= 64:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor() as executor:
+            blocks = list(executor.map(_format_opportunity, numbered))
+    else:
+        blocks = [_format_opportunity(item) for item in numbered]
+
+    header = f"\n{_SEP}\nARBITRAGE OPPORTUNITIES DETECTED: {len(opportunities)}\n{_SEP}\n\n"
+    sys.stdout.write(header + '\n'.join(blocks) + '\n')
@@ -2,9 +2,32 @@
 Provider reliability and availability analysis.
 """
 
-from typing import List, Dict, Any
 from collections import defaultdict
-import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Below this many providers the thread-pool overhead outweighs the win;
+# use the single vectorized groupby instead
+_PARALLEL_PROVIDER_THRESHOLD = 8
+
+
+def _summarize_provider(item: Tuple[str, List[float]]) -> Dict[str, Any]:
+    """Compute the reliability record for one provider's availability list."""
+    provider, availabilities = item
+    arr = np.asarray(availabilities, dtype=np.float32)
+    std = float(np.std(arr, ddof=1, dtype=np.float64)) if arr.size > 1 else 0.0
+
+    return {
+        'provider': provider,
+        'avg_availability': round(float(arr.mean(dtype=np.float64)), 4),
+        'min_availability': round(float(arr.min()), 4),
+        'max_availability': round(float(arr.max()), 4),
+        'sample_count': int(arr.size),
+        'consistency': round(1 - std, 4),
+    }
 
 
 def analyze_provider_reliability(
@@ -19,55 +42,107 @@ def analyze_provider_reliability(
     Returns:
         List of provider reliability scores
     """
-    # Group by provider
-    by_provider = defaultdict(list)
+    # Hoist the dict lookups into locals so each row pays two .get calls
+    # instead of four
+    rows = []
     for price in prices:
         provider = price.get('provider')
         availability = price.get('availability')
         if provider and availability is not None:
-            by_provider[provider].append(availability)
+            rows.append((provider, availability))
 
-    # Calculate reliability metrics
-    reliability = []
-    for provider, availabilities in by_provider.items():
-        reliability.append({
-            'provider': provider,
-            'avg_availability': round(statistics.mean(availabilities), 4),
-            'min_availability': round(min(availabilities), 4),
-            'max_availability': round(max(availabilities), 4),
-            'consistency': round(1 - statistics.stdev(availabilities), 4) if len(availabilities) > 1 else 1.0,
-            'sample_count': len(availabilities),
-        })
+    if not rows:
+        return []
 
-    # Sort by average availability (descending)
-    reliability.sort(key=lambda x: x['avg_availability'], reverse=True)
+    # Providers are independent units of work: with many of them, fan the
+    # per-group NumPy summaries out across a thread pool
+    by_provider = defaultdict(list)
+    for provider, availability in rows:
+        by_provider[provider].append(availability)
 
-    return reliability
+    if len(by_provider) >= _PARALLEL_PROVIDER_THRESHOLD:
+        with ThreadPoolExecutor() as executor:
+            reliability = list(executor.map(_summarize_provider, by_provider.items()))
+        reliability.sort(key=lambda x: x['avg_availability'], reverse=True)
+        return reliability
 
+    # Single groupby pass computes all per-provider aggregates in C,
+    # replacing the per-group mean/min/max/stdev Python loops
+    df = pd.DataFrame(rows, columns=['provider', 'availability'])
+    agg = df.groupby('provider')['availability'].agg(
+        ['mean', 'min', 'max', 'std', 'count']
+    ).reset_index()
 
-def calculate_value_score(
-    price: Dict[str, Any],
+    # Single-sample groups have NaN std; treat them as perfectly consistent
+    agg['consistency'] = 1 - agg['std'].fillna(0)
+
+    agg = agg.sort_values('mean', ascending=False)
+    agg = agg.rename(columns={
+        'mean': 'avg_availability',
+        'min': 'min_availability',
+        'max': 'max_availability',
+        'count': 'sample_count',
+    })
+    agg[['avg_availability', 'min_availability', 'max_availability', 'consistency']] = (
+        agg[['avg_availability', 'min_availability', 'max_availability', 'consistency']].round(4)
+    )
+
+    return agg.drop(columns='std').to_dict('records')
+
+
+def calculate_value_scores(
+    prices_per_hour: Any,
+    availabilities: Any,
     weight_price: float = 0.6,
     weight_availability: float = 0.4,
-) -> float:
+) -> np.ndarray:
     """
-    Calculate overall value score combining price and availability.
+    Calculate value scores for a whole batch of prices at once.
+
+    One vectorized NumPy expression replaces a Python function call per
+    price; accepts any array-likes (including PriceTable float32 columns).
 
     Args:
-        price: Price dictionary
+        prices_per_hour: Array-like of prices in USD/hour
+        availabilities: Array-like of 0-1 availability values
         weight_price: Weight for price component
         weight_availability: Weight for availability component
 
     Returns:
-        Value score (higher is better)
+        Array of value scores (higher is better)
     """
     # Normalize components (0-1 scale, higher is better)
     # For price: lower is better, so invert
     # For availability: higher is better
+    price_arr = np.asarray(prices_per_hour, dtype=np.float64)
+    avail_arr = np.asarray(availabilities, dtype=np.float64)
 
-    price_score = 1.0 / (price['price_per_hour'] + 0.01)  # Avoid division by zero
-    availability_score = price.get('availability', 0.5)
+    return weight_price / (price_arr + 0.01) + weight_availability * avail_arr
 
-    value_score = (weight_price * price_score) + (weight_availability * availability_score)
 
-    return value_score
+def calculate_value_score(
+    price: Dict[str, Any],
+    weight_price: float = 0.6,
+    weight_availability: float = 0.4,
+) -> float:
+    """
+    Calculate overall value score combining price and availability.
+
+    Thin scalar wrapper over calculate_value_scores; prefer the vectorized
+    form when scoring many prices.
+
+    Args:
+        price: Price dictionary
+        weight_price: Weight for price component
+        weight_availability: Weight for availability component
+
+    Returns:
+        Value score (higher is better)
+    """
+    scores = calculate_value_scores(
+        [price['price_per_hour']],
+        [price.get('availability', 0.5)],
+        weight_price,
+        weight_availability,
+    )
+    return float(scores[0])
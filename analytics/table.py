@@ -0,0 +1,54 @@
+"""
+Structure-of-arrays container for GPU price records.
+
+Bulk analytics over List[Dict] price records pay a hash lookup per field
+access and walk a large object graph. PriceTable stores each field once as
+a contiguous column (NumPy arrays for numerics, pandas Categorical for the
+low-cardinality string fields), so reductions and groupbys run over packed
+memory instead of per-dict traversal.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+
+class PriceTable:
+    """
+    Columnar (structure-of-arrays) view over a batch of price records.
+
+    The original row dicts are retained in `rows` so callers can still
+    materialize individual records; the columns are built once at ingest.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self.rows: List[Dict[str, Any]] = list(rows)
+
+        self.provider = pd.Categorical([r.get('provider') for r in self.rows])
+        self.region = pd.Categorical([r.get('region') for r in self.rows])
+        self.gpu_model = pd.Categorical([r.get('gpu_model') for r in self.rows])
+        # float32 is plenty for $/hour and 0-1 availability, and halves the
+        # bytes moved through every reduction; accumulate in float64 where
+        # accuracy matters (e.g. np.mean(..., dtype=np.float64))
+        self.price_per_hour = np.fromiter(
+            (r.get('price_per_hour', 0.0) for r in self.rows),
+            dtype=np.float32,
+            count=len(self.rows),
+        )
+        self.availability = np.fromiter(
+            (r.get('availability', 1.0) for r in self.rows),
+            dtype=np.float32,
+            count=len(self.rows),
+        )
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> "PriceTable":
+        """Build a PriceTable from standard price dictionaries."""
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        return f"PriceTable(rows={len(self.rows)})"
@@ -4,10 +4,12 @@ Price trend analysis for GPU pricing data.
 Analyzes historical pricing data to identify trends and patterns.
 """
 
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
-import statistics
+
+import numpy as np
+import pandas as pd
 
 
 def analyze_price_trends(
@@ -36,17 +38,21 @@ def analyze_price_trends(
     if not filtered:
         return {'error': 'No data available for analysis'}
 
-    # Extract prices
-    price_values = [p['price_per_hour'] for p in filtered if 'price_per_hour' in p]
+    # Extract prices into a contiguous float32 array (halves the bytes the
+    # reductions have to move); accumulate in float64 for accuracy
+    price_values = np.fromiter(
+        (p['price_per_hour'] for p in filtered if 'price_per_hour' in p),
+        dtype=np.float32,
+    )
 
-    if not price_values:
+    if price_values.size == 0:
         return {'error': 'No price data available'}
 
-    # Calculate statistics
-    avg_price = statistics.mean(price_values)
-    min_price = min(price_values)
-    max_price = max(price_values)
-    std_dev = statistics.stdev(price_values) if len(price_values) > 1 else 0
+    # Calculate statistics (vectorized single-pass reductions)
+    avg_price = float(price_values.mean(dtype=np.float64))
+    min_price = float(price_values.min())
+    max_price = float(price_values.max())
+    std_dev = float(np.std(price_values, ddof=1, dtype=np.float64)) if price_values.size > 1 else 0.0
 
     # Calculate volatility (coefficient of variation)
     volatility = (std_dev / avg_price * 100) if avg_price > 0 else 0
@@ -54,7 +60,7 @@ def analyze_price_trends(
     return {
         'gpu_model': gpu_model or 'all',
         'provider': provider or 'all',
-        'sample_count': len(price_values),
+        'sample_count': int(price_values.size),
         'avg_price': round(avg_price, 4),
         'min_price': round(min_price, 4),
         'max_price': round(max_price, 4),
@@ -79,29 +85,32 @@ def compare_regions(
         List of region comparisons
     """
     # Filter to specific GPU
-    gpu_prices = [p for p in prices if p.get('gpu_model') == gpu_model]
+    rows = [
+        (f"{p['provider']} - {p['region']}", p['price_per_hour'])
+        for p in prices if p.get('gpu_model') == gpu_model
+    ]
 
-    # Group by region
-    by_region = defaultdict(list)
-    for price in gpu_prices:
-        region = f"{price['provider']} - {price['region']}"
-        by_region[region].append(price['price_per_hour'])
+    if not rows:
+        return []
 
-    # Calculate stats for each region
-    comparisons = []
-    for region, region_prices in by_region.items():
-        comparisons.append({
-            'region': region,
-            'avg_price': round(statistics.mean(region_prices), 2),
-            'min_price': round(min(region_prices), 2),
-            'max_price': round(max(region_prices), 2),
-            'sample_count': len(region_prices),
-        })
+    # One groupby pass replaces the per-region mean/min/max Python loops
+    df = pd.DataFrame(rows, columns=['region', 'price_per_hour'])
+    agg = df.groupby('region')['price_per_hour'].agg(
+        ['mean', 'min', 'max', 'count']
+    ).reset_index()
 
-    # Sort by average price
-    comparisons.sort(key=lambda x: x['avg_price'])
+    agg = agg.sort_values('mean')
+    agg = agg.rename(columns={
+        'mean': 'avg_price',
+        'min': 'min_price',
+        'max': 'max_price',
+        'count': 'sample_count',
+    })
+    agg[['avg_price', 'min_price', 'max_price']] = (
+        agg[['avg_price', 'min_price', 'max_price']].round(2)
+    )
 
-    return comparisons
+    return agg.to_dict('records')
 
 
 def detect_price_anomalies(
@@ -124,18 +133,28 @@ def detect_price_anomalies(
     if len(prices) < 3:
         return []
 
-    price_values = [p['price_per_hour'] for p in prices]
-    mean_price = statistics.mean(price_values)
-    std_dev = statistics.stdev(price_values)
+    # itemgetter keeps the per-element field access at C level
+    price_values = np.fromiter(
+        map(itemgetter('price_per_hour'), prices),
+        dtype=np.float32,
+        count=len(prices),
+    )
+    mean_price = float(price_values.mean(dtype=np.float64))
+    std_dev = float(np.std(price_values, ddof=1, dtype=np.float64))
+
+    if std_dev <= 0:
+        return []
+
+    # Vectorized outlier test: one fused subtract/abs/compare over the whole
+    # array, then only the flagged entries are touched in Python
+    deviations = np.abs(price_values - mean_price)
+    outlier_indices = np.flatnonzero(deviations > threshold_std_devs * std_dev)
 
     anomalies = []
-    for price in prices:
-        deviation = abs(price['price_per_hour'] - mean_price) / std_dev if std_dev > 0 else 0
-
-        if deviation > threshold_std_devs:
-            price_copy = price.copy()
-            price_copy['deviation_std_devs'] = round(deviation, 2)
-            price_copy['deviation_from_mean'] = round(price['price_per_hour'] - mean_price, 2)
-            anomalies.append(price_copy)
+    for i in outlier_indices:
+        price_copy = prices[i].copy()
+        price_copy['deviation_std_devs'] = round(float(deviations[i]) / std_dev, 2)
+        price_copy['deviation_from_mean'] = round(float(price_values[i]) - mean_price, 2)
+        anomalies.append(price_copy)
 
     return anomalies
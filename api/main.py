@@ -11,16 +11,28 @@ Production deployment:
 - Containerize with Docker for portability
 """
 
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import functools
+import hashlib
+import inspect
+import itertools
+import logging
+
+import numpy as np
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from data_collection.scheduler import PricingScheduler
 from storage.db import Database
 from storage.cache import get_cache
-from normalization.normalize import normalize_prices, rank_by_cost_performance
-from normalization.cost_score import calculate_cost_scores, compare_providers_by_gpu
+from normalization.gpu_specs import GPU_SPECS
+from normalization.normalize import normalize_prices, rank_by_cost_performance, invalidate_rank_cache
+from normalization.cost_score import calculate_cost_scores, compare_providers_by_gpu, invalidate_score_cache
 from analytics.arbitrage import ArbitrageDetector, print_arbitrage_report
 from analytics.reliability import analyze_provider_reliability
 
@@ -31,6 +43,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes the large price/opportunity payloads in C
+    default_response_class=ORJSONResponse,
 )
 
 # Enable CORS for frontend access
@@ -42,11 +56,144 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Drop the providers' per-fetch debug lines without even formatting them
+logging.getLogger("data_collection").setLevel(logging.WARNING)
+
 # Global instances
 scheduler = PricingScheduler()
 cache = get_cache(ttl_seconds=300)
 db = Database("gpu_prices.db")
 
+# Fully static payloads, built once at import so the endpoints just
+# return a reference instead of rebuilding the dicts per request
+_PROVIDERS_PAYLOAD = {
+    "providers": [
+        {"name": "AWS", "description": "Amazon Web Services EC2 GPU instances"},
+        {"name": "GCP", "description": "Google Cloud Platform GPU instances"},
+        {"name": "Azure", "description": "Microsoft Azure GPU instances"},
+        {"name": "RunPod", "description": "RunPod GPU cloud"},
+        {"name": "Vast.ai", "description": "Vast.ai GPU marketplace"},
+        {"name": "Lambda Labs", "description": "Lambda Labs GPU cloud"},
+    ]
+}
+
+_GPU_MODELS_PAYLOAD = {
+    "count": len(GPU_SPECS),
+    "models": [
+        {
+            "model": model,
+            "tflops_fp32": specs["tflops_fp32"],
+            "memory_gb": specs["memory_gb"],
+            "architecture": specs["architecture"],
+        }
+        for model, specs in GPU_SPECS.items()
+    ],
+}
+
+# Serialized once at import; served with long-lived cache headers
+_PROVIDERS_BODY = orjson.dumps(_PROVIDERS_PAYLOAD)
+_PROVIDERS_ETAG = hashlib.blake2b(_PROVIDERS_BODY, digest_size=8).hexdigest()
+_GPU_MODELS_BODY = orjson.dumps(_GPU_MODELS_PAYLOAD)
+_GPU_MODELS_ETAG = hashlib.blake2b(_GPU_MODELS_BODY, digest_size=8).hexdigest()
+
+
+def cached(expire: int = 300):
+    """
+    Decorator-driven response caching for read-only endpoints.
+
+    Caches the endpoint's response keyed on its call arguments, so the
+    manual cache.get/cache.set blocks disappear from the endpoint bodies.
+    The cache stores pre-serialized orjson bytes, so a hit returns a raw
+    Response and skips dict-walking and JSON encoding entirely. Responses
+    carry an ETag and Cache-Control so clients and intermediaries can
+    revalidate with a 304 instead of re-downloading the payload.
+
+    In production, this would be fastapi-cache2 with a RedisBackend
+    initialized in a lifespan hook (@cache(expire=300)), giving a cache
+    shared across Uvicorn workers; here the in-process PriceCache stands
+    in for Redis.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, request: Request, **kwargs):
+            key = f"{func.__name__}:" + ":".join(
+                f"{name}={kwargs[name]}" for name in sorted(kwargs)
+            )
+            hit = cache.get(key)
+            if hit is not None:
+                body, etag = hit
+            else:
+                payload = await func(*args, **kwargs)
+                body = orjson.dumps(payload)
+                etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+                cache.set(key, (body, etag), ttl_seconds=expire)
+
+            return _conditional_response(request, body, etag, expire)
+
+        # FastAPI reads the wrapped signature; splice the request parameter
+        # in so the framework injects it alongside the original query params
+        sig = inspect.signature(func)
+        wrapper.__signature__ = sig.replace(parameters=[
+            *sig.parameters.values(),
+            inspect.Parameter(
+                'request',
+                kind=inspect.Parameter.KEYWORD_ONLY,
+                annotation=Request,
+            ),
+        ])
+        return wrapper
+    return decorator
+
+
+def _conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    max_age: int,
+    immutable: bool = False,
+) -> Response:
+    """Serve pre-serialized bytes with ETag/Cache-Control, or a bare 304."""
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cache_control = (
+        f"public, max-age={max_age}, immutable" if immutable
+        else f"public, max-age={max_age}, stale-while-revalidate=60"
+    )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+# Single-flight fetch coalescing: when several requests miss the cache at
+# once, only one scheduler fetch per filter combination actually runs and
+# the rest await its result
+_inflight: Dict[Any, asyncio.Task] = {}
+_inflight_lock = asyncio.Lock()
+
+
+async def fetch_bundle(
+    gpu_model: Optional[str] = None,
+    provider: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Fetch the scheduler bundle, coalescing concurrent duplicate fetches."""
+    key = (gpu_model, provider)
+    async with _inflight_lock:
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                scheduler.afetch_all_prices(gpu_model=gpu_model, provider=provider)
+            )
+            _inflight[key] = task
+    try:
+        return await task
+    finally:
+        async with _inflight_lock:
+            if _inflight.get(key) is task:
+                del _inflight[key]
+
 
 @app.get("/")
 async def root():
@@ -76,6 +223,7 @@ async def health_check():
 
 
 @app.get("/prices/latest")
+@cached(expire=300)
 async def get_latest_prices(
     gpu_model: Optional[str] = Query(None, description="Filter by GPU model (e.g., 'A100')"),
     provider: Optional[str] = Query(None, description="Filter by provider (e.g., 'AWS')"),
@@ -86,32 +234,14 @@ async def get_latest_prices(
 
     Uses cache for sub-second response times.
     """
-    cache_key = f"latest_prices:{gpu_model}:{provider}:{limit}"
-
-    # Try cache first
-    cached = cache.get(cache_key)
-    if cached:
-        return {
-            "source": "cache",
-            "count": len(cached),
-            "prices": cached,
-        }
-
-    # Fetch fresh data
-    result = scheduler.fetch_all_prices(parallel=True)
+    # Fetch fresh data with filters pushed into the scheduler, so a
+    # provider filter skips the other providers' fetches entirely
+    result = await fetch_bundle(gpu_model=gpu_model, provider=provider)
     prices = result['prices']
 
-    # Apply filters
-    if gpu_model:
-        prices = [p for p in prices if p.get('gpu_model') == gpu_model]
-    if provider:
-        prices = [p for p in prices if p.get('provider') == provider]
-
-    # Limit results
-    prices = prices[:limit]
-
-    # Cache the results
-    cache.set(cache_key, prices)
+    # Limit results (skip the copy when the list is already within bounds)
+    if len(prices) > limit:
+        prices = prices[:limit]
 
     return {
         "source": "live",
@@ -122,13 +252,39 @@ async def get_latest_prices(
     }
 
 
+@app.get("/prices/latest.ndjson")
+async def stream_latest_prices(
+    gpu_model: Optional[str] = Query(None, description="Filter by GPU model (e.g., 'A100')"),
+    provider: Optional[str] = Query(None, description="Filter by provider (e.g., 'AWS')"),
+    limit: int = Query(100, description="Maximum number of results"),
+):
+    """
+    Stream latest prices as NDJSON (one JSON object per line).
+
+    Rows go onto the wire as they are serialized, so memory stays flat
+    and the first byte arrives before the whole payload is encoded —
+    the right shape for very large limits.
+    """
+    result = await fetch_bundle(gpu_model=gpu_model, provider=provider)
+    prices = result['prices']
+
+    async def generate():
+        for row in itertools.islice(prices, limit):
+            yield orjson.dumps(row) + b'\n'
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.get("/prices/history")
 async def get_price_history(
     gpu_model: str = Query(..., description="GPU model (e.g., 'A100')"),
     hours: int = Query(24, description="Hours of history to retrieve"),
 ):
     """Get historical prices for a GPU model."""
-    prices = db.get_prices_by_gpu(gpu_model, hours=hours)
+    # SQLite calls block; run them on the threadpool so the event loop
+    # keeps serving other requests (provider fetches already go through
+    # asyncio.to_thread in afetch_all_prices)
+    prices = await run_in_threadpool(db.get_prices_by_gpu, gpu_model, hours=hours)
 
     if not prices:
         raise HTTPException(status_code=404, detail=f"No price history found for {gpu_model}")
@@ -142,6 +298,7 @@ async def get_price_history(
 
 
 @app.get("/arbitrage/best")
+@cached(expire=300)
 async def get_best_arbitrage(
     min_savings_percent: float = Query(10.0, description="Minimum savings percentage"),
 ):
@@ -150,45 +307,32 @@ async def get_best_arbitrage(
 
     Returns opportunities sorted by potential savings.
     """
-    cache_key = f"arbitrage:best:{min_savings_percent}"
-
-    # Try cache
-    cached = cache.get(cache_key)
-    if cached:
-        return {"source": "cache", **cached}
-
-    # Fetch and analyze
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    # Fetch and analyze over the columnar table built by the scheduler
+    result = await fetch_bundle()
 
     detector = ArbitrageDetector(
         min_percentage_savings=min_savings_percent,
         min_providers=2,
     )
 
-    opportunities = detector.detect_opportunities(prices, precision="fp32")
+    opportunities = detector.detect_opportunities(result['table'], precision="fp32")
 
     # Convert to dict format
     opps_data = [opp.to_dict() for opp in opportunities]
 
-    response = {
+    return {
         "source": "live",
         "count": len(opps_data),
         "opportunities": opps_data,
     }
 
-    # Cache results
-    cache.set(cache_key, response)
-
-    return response
-
 
 @app.get("/arbitrage/gpu/{gpu_model}")
 async def get_arbitrage_for_gpu(
     gpu_model: str,
 ):
     """Get arbitrage opportunity for a specific GPU model."""
-    result = scheduler.fetch_all_prices(parallel=True)
+    result = await fetch_bundle(gpu_model=gpu_model)
     prices = result['prices']
 
     detector = ArbitrageDetector(min_percentage_savings=5.0)
@@ -207,41 +351,50 @@ async def get_arbitrage_for_gpu(
 
 
 @app.get("/analytics/trends")
+@cached(expire=300)
 async def get_price_trends(
     gpu_model: Optional[str] = Query(None, description="Filter by GPU model"),
 ):
     """Get price trends and analytics."""
-    result = scheduler.fetch_all_prices(parallel=True)
+    result = await fetch_bundle(gpu_model=gpu_model)
     prices = result['prices']
 
-    if gpu_model:
-        prices = [p for p in prices if p.get('gpu_model') == gpu_model]
-
     # Normalize and rank
     normalized = normalize_prices(prices, precision="fp32")
     ranked = rank_by_cost_performance(prices, gpu_model=gpu_model, precision="fp32")
 
+    # The scheduler's columnar table already holds the prices as a
+    # contiguous float32 array; reductions run vectorized over it
+    price_arr = result['table'].price_per_hour
+
+    if price_arr.size:
+        stats = {
+            "avg_price": float(price_arr.mean(dtype=np.float64)),
+            "min_price": float(price_arr.min()),
+            "max_price": float(price_arr.max()),
+        }
+    else:
+        stats = {"avg_price": 0, "min_price": 0, "max_price": 0}
+
     return {
         "total_prices": len(prices),
         "gpu_model": gpu_model,
         "top_values": ranked[:10] if ranked else [],
-        "stats": {
-            "avg_price": sum(p['price_per_hour'] for p in prices) / len(prices) if prices else 0,
-            "min_price": min((p['price_per_hour'] for p in prices), default=0),
-            "max_price": max((p['price_per_hour'] for p in prices), default=0),
-        }
+        "stats": stats,
     }
 
 
 @app.get("/analytics/comparison")
+@cached(expire=300)
 async def compare_gpu_providers(
     gpu_model: str = Query(..., description="GPU model to compare"),
 ):
     """Compare all providers offering a specific GPU."""
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    result = await fetch_bundle()
 
-    comparison = compare_providers_by_gpu(prices, gpu_model, precision="fp32")
+    # by_gpu index: O(1) lookup instead of rescanning the full price list
+    gpu_prices = result['by_gpu'].get(gpu_model, [])
+    comparison = compare_providers_by_gpu(gpu_prices, gpu_model, precision="fp32")
 
     if 'error' in comparison:
         raise HTTPException(status_code=404, detail=comparison['error'])
@@ -250,24 +403,18 @@ async def compare_gpu_providers(
 
 
 @app.get("/providers/list")
-async def list_providers():
+async def list_providers(request: Request):
     """List all available providers."""
-    return {
-        "providers": [
-            {"name": "AWS", "description": "Amazon Web Services EC2 GPU instances"},
-            {"name": "GCP", "description": "Google Cloud Platform GPU instances"},
-            {"name": "Azure", "description": "Microsoft Azure GPU instances"},
-            {"name": "RunPod", "description": "RunPod GPU cloud"},
-            {"name": "Vast.ai", "description": "Vast.ai GPU marketplace"},
-            {"name": "Lambda Labs", "description": "Lambda Labs GPU cloud"},
-        ]
-    }
+    return _conditional_response(
+        request, _PROVIDERS_BODY, _PROVIDERS_ETAG, 86400, immutable=True
+    )
 
 
 @app.get("/providers/reliability")
+@cached(expire=300)
 async def get_provider_reliability():
     """Get provider reliability scores based on availability."""
-    result = scheduler.fetch_all_prices(parallel=True)
+    result = await fetch_bundle()
     prices = result['prices']
 
     reliability = analyze_provider_reliability(prices)
@@ -279,23 +426,11 @@ async def get_provider_reliability():
 
 
 @app.get("/gpu/models")
-async def list_gpu_models():
+async def list_gpu_models(request: Request):
     """List all available GPU models with specifications."""
-    from normalization.gpu_specs import GPU_SPECS
-
-    models = []
-    for model, specs in GPU_SPECS.items():
-        models.append({
-            "model": model,
-            "tflops_fp32": specs["tflops_fp32"],
-            "memory_gb": specs["memory_gb"],
-            "architecture": specs["architecture"],
-        })
-
-    return {
-        "count": len(models),
-        "models": models,
-    }
+    return _conditional_response(
+        request, _GPU_MODELS_BODY, _GPU_MODELS_ETAG, 86400, immutable=True
+    )
 
 
 @app.post("/prices/refresh")
@@ -304,11 +439,18 @@ async def refresh_prices():
     # Clear cache
     cache.clear()
 
-    # Fetch fresh prices
-    result = scheduler.fetch_all_prices(parallel=True)
+    # The rank/score caches key on list identity; a refreshed bundle can
+    # reuse a freed list's id at the same length, so they must be
+    # flushed whenever the price lists are replaced. (The arbitrage
+    # detectors here are per-request, so their caches die on their own.)
+    invalidate_rank_cache()
+    invalidate_score_cache()
+
+    # Fetch fresh prices, bypassing the scheduler's interval cache
+    result = await scheduler.afetch_all_prices(force_refresh=True)
 
-    # Store in database
-    count = db.insert_prices_bulk(result['prices'])
+    # Store in database (blocking SQLite write, off the event loop)
+    count = await run_in_threadpool(db.insert_prices_bulk, result['prices'])
 
     return {
         "status": "success",
@@ -322,7 +464,7 @@ async def refresh_prices():
 @app.get("/stats")
 async def get_database_stats():
     """Get database statistics."""
-    stats = db.get_price_stats()
+    stats = await run_in_threadpool(db.get_price_stats)
     cache_stats = cache.stats()
 
     return {
@@ -332,5 +474,22 @@ async def get_database_stats():
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+
+    # uvloop + httptools (bundled with uvicorn[standard]) replace the
+    # Python-level event loop and HTTP parser with C implementations;
+    # one worker per CPU and quiet logs keep the hot path off stdout
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+        limit_concurrency=1000,
+        backlog=2048,
+    )
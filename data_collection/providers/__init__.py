@@ -1,21 +1,29 @@
 """
 GPU pricing providers module.
 
-Exports all available provider classes for easy import.
+Exports all available provider classes for easy import. The provider
+modules are loaded lazily (PEP 562) so importing the package costs
+nothing until a class is actually used.
 """
 
-from .aws import AWSProvider
-from .gcp import GCPProvider
-from .azure import AzureProvider
-from .runpod import RunPodProvider
-from .vast import VastProvider
-from .lambda_labs import LambdaProvider
+import importlib
 
-__all__ = [
-    'AWSProvider',
-    'GCPProvider',
-    'AzureProvider',
-    'RunPodProvider',
-    'VastProvider',
-    'LambdaProvider',
-]
+_PROVIDER_MODULES = {
+    'AWSProvider': '.aws',
+    'GCPProvider': '.gcp',
+    'AzureProvider': '.azure',
+    'RunPodProvider': '.runpod',
+    'VastProvider': '.vast',
+    'LambdaProvider': '.lambda_labs',
+}
+
+__all__ = list(_PROVIDER_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module_name = _PROVIDER_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
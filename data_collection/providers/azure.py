@@ -6,8 +6,12 @@ For this project: Uses mock data with clear documentation of API mapping
 """
 
 from typing import List, Dict, Any
+import logging
+
 from .base import BaseProvider
 
+logger = logging.getLogger(__name__)
+
 
 class AzureProvider(BaseProvider):
     """
@@ -25,6 +29,10 @@ class AzureProvider(BaseProvider):
         - Standard_NC4as_T4_v3: 1x T4 (16GB)
     """
 
+    provider_name = 'Azure'
+
+    __slots__ = ()
+
     def __init__(self, use_mock: bool = True):
         """
         Initialize Azure provider.
@@ -42,7 +50,7 @@ class AzureProvider(BaseProvider):
             List of standardized pricing dictionaries
         """
         if self.use_mock:
-            print(f"📦 Using mock data for Azure (no real API call)")
+            logger.debug("Using mock data for Azure (no real API call)")
             return self._load_mock_data()
 
         # Production implementation would go here:
@@ -87,9 +95,11 @@ def test_azure_provider():
             print("-" * 60)
 
     # Validate schema
-    required_fields = ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+    required_fields = frozenset(
+        ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+    )
     for price in prices:
-        assert all(field in price for field in required_fields), f"Missing fields in: {price}"
+        assert required_fields <= price.keys(), f"Missing fields in: {price}"
 
     print("\n✅ Azure Provider validation passed!\n")
     return prices
@@ -4,15 +4,58 @@ All provider implementations should inherit from this class.
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import List, Dict, Any
-import json
+import functools
+import logging
 import os
+import time
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Timestamp string memoized at 1-second granularity: all providers in a
+# refresh share one formatted string instead of each building a datetime
+# and isoformat()-ing it per batch
+_ts_cache = (0, '')
+
+# Schema fields every price record must carry
+_REQUIRED_FIELDS = frozenset(
+    {'provider', 'region', 'gpu_model', 'price_per_hour', 'availability'}
+)
+
+
+def _batch_timestamp() -> str:
+    """Current UTC time as ISO8601, cached for the current second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)))
+    return _ts_cache[1]
+
+
+@functools.lru_cache(maxsize=4)
+def _load_all_mock(path: str) -> Dict[str, Any]:
+    """Read and parse a mock pricing file once per process (orjson C decoder)."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 class BaseProvider(ABC):
     """Base class for all GPU pricing providers."""
 
+    # Display name, set per subclass: a plain class attribute instead of
+    # reflection over the class name at construction time
+    provider_name = ''
+
+    # Shared by all providers, so a class-level constant
+    mock_data_path = os.path.join(
+        os.path.dirname(__file__),
+        '../../mock_data/pricing_samples.json'
+    )
+
+    __slots__ = ('use_mock', '_mock_cache')
+
     def __init__(self, use_mock: bool = True):
         """
         Initialize the provider.
@@ -21,11 +64,9 @@ class BaseProvider(ABC):
             use_mock: Whether to use mock data (default True for college project)
         """
         self.use_mock = use_mock
-        self.provider_name = self.__class__.__name__.replace('Provider', '')
-        self.mock_data_path = os.path.join(
-            os.path.dirname(__file__),
-            '../../mock_data/pricing_samples.json'
-        )
+        # Pristine mock rows resolved once at construction; fetches copy
+        # from here instead of re-resolving the file and provider key
+        self._mock_cache = self._read_mock_rows() if use_mock else None
 
     @abstractmethod
     def fetch_prices(self) -> List[Dict[str, Any]]:
@@ -37,23 +78,39 @@ class BaseProvider(ABC):
         """
         pass
 
-    def _load_mock_data(self) -> List[Dict[str, Any]]:
-        """Load mock pricing data from JSON file."""
+    def _read_mock_rows(self) -> List[Dict[str, Any]]:
+        """Resolve this provider's rows from the (process-cached) mock file."""
         try:
-            with open(self.mock_data_path, 'r') as f:
-                all_data = json.load(f)
-                provider_key = self.provider_name.lower()
-                return all_data.get(provider_key, [])
+            all_data = _load_all_mock(self.mock_data_path)
+            return all_data.get(self.provider_name.lower(), [])
         except FileNotFoundError:
-            print(f"⚠️  Mock data file not found: {self.mock_data_path}")
+            logger.warning("Mock data file not found: %s", self.mock_data_path)
             return []
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Error parsing mock data: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Error parsing mock data: %s", e)
             return []
 
+    def _load_mock_data(self) -> List[Dict[str, Any]]:
+        """
+        Load mock pricing data from the JSON file.
+
+        The rows live on the instance from construction time; each call
+        returns fresh per-row dict copies so timestamping a new fetch
+        never mutates rows handed out earlier.
+        """
+        rows = self._mock_cache if self._mock_cache is not None else self._read_mock_rows()
+        return [dict(row) for row in rows]
+
     def _add_timestamp(self, prices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Add ISO8601 timestamp to each price entry."""
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        """
+        Add ISO8601 timestamp to each price entry.
+
+        Every row in the batch shares one memoized string (a pointer write
+        per row), so the datetime formatting happens at most once a second
+        across all providers. The per-row field stays because the DB schema
+        and validation scripts expect it on each record.
+        """
+        timestamp = _batch_timestamp()
         for price in prices:
             price['timestamp'] = timestamp
         return prices
@@ -70,16 +127,15 @@ class BaseProvider(ABC):
             "timestamp": str (ISO8601)
         }
         """
-        standardized = []
-        required_fields = ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability']
+        # C-level subset test: one frozenset comparison per row instead of
+        # five Python `in` checks
+        standardized = [p for p in prices if _REQUIRED_FIELDS <= p.keys()]
 
-        for price in prices:
-            # Check for required fields
-            if all(field in price for field in required_fields):
-                standardized.append(price)
-            else:
-                missing = [f for f in required_fields if f not in price]
-                print(f"⚠️  Skipping invalid price entry (missing: {missing})")
+        if len(standardized) != len(prices):
+            for price in prices:
+                missing = _REQUIRED_FIELDS - price.keys()
+                if missing:
+                    logger.warning("Skipping invalid price entry (missing: %s)", sorted(missing))
 
         return standardized
 
@@ -96,9 +152,9 @@ class BaseProvider(ABC):
             prices = self._standardize_output(prices)
             return prices
         except Exception as e:
-            print(f"❌ Error fetching prices from {self.provider_name}: {e}")
+            logger.warning("Error fetching prices from %s: %s", self.provider_name, e)
             if self.use_mock:
-                print(f"📦 Falling back to mock data for {self.provider_name}")
+                logger.debug("Falling back to mock data for %s", self.provider_name)
                 prices = self._load_mock_data()
                 prices = self._add_timestamp(prices)
                 return prices
@@ -6,8 +6,12 @@ For this project: Uses mock data with clear documentation of API mapping
 """
 
 from typing import List, Dict, Any
+import logging
+
 from .base import BaseProvider
 
+logger = logging.getLogger(__name__)
+
 
 class GCPProvider(BaseProvider):
     """
@@ -25,6 +29,10 @@ class GCPProvider(BaseProvider):
         - n1-standard-4 + nvidia-tesla-t4: T4
     """
 
+    provider_name = 'GCP'
+
+    __slots__ = ('credentials_path',)
+
     def __init__(self, use_mock: bool = True, credentials_path: str = None):
         """
         Initialize GCP provider.
@@ -44,7 +52,7 @@ class GCPProvider(BaseProvider):
             List of standardized pricing dictionaries
         """
         if self.use_mock:
-            print(f"📦 Using mock data for GCP (no real API call)")
+            logger.debug("Using mock data for GCP (no real API call)")
             return self._load_mock_data()
 
         # Production implementation would go here:
@@ -87,9 +95,11 @@ def test_gcp_provider():
             print("-" * 60)
 
     # Validate schema
-    required_fields = ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+    required_fields = frozenset(
+        ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+    )
     for price in prices:
-        assert all(field in price for field in required_fields), f"Missing fields in: {price}"
+        assert required_fields <= price.keys(), f"Missing fields in: {price}"
 
     print("\n✅ GCP Provider validation passed!\n")
     return prices
@@ -6,8 +6,12 @@ For this project: Uses mock data with clear documentation of API mapping
 """
 
 from typing import List, Dict, Any
+import logging
+
 from .base import BaseProvider
 
+logger = logging.getLogger(__name__)
+
 
 class RunPodProvider(BaseProvider):
     """
@@ -26,6 +30,10 @@ class RunPodProvider(BaseProvider):
         - L40
     """
 
+    provider_name = 'RunPod'
+
+    __slots__ = ('api_key',)
+
     def __init__(self, use_mock: bool = True, api_key: str = None):
         """
         Initialize RunPod provider.
@@ -45,7 +53,7 @@ class RunPodProvider(BaseProvider):
             List of standardized pricing dictionaries
         """
         if self.use_mock:
-            print(f"📦 Using mock data for RunPod (no real API call)")
+            logger.debug("Using mock data for RunPod (no real API call)")
             return self._load_mock_data()
 
         # Production implementation would go here:
@@ -102,9 +110,11 @@ def test_runpod_provider():
             print("-" * 60)
 
     # Validate schema
-    required_fields = ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+    required_fields = frozenset(
+        ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+    )
     for price in prices:
-        assert all(field in price for field in required_fields), f"Missing fields in: {price}"
+        assert required_fields <= price.keys(), f"Missing fields in: {price}"
 
     print("\n✅ RunPod Provider validation passed!\n")
     return prices
@@ -12,14 +12,17 @@ Usage:
 
 import argparse
 import sys
-from data_collection.scheduler import PricingScheduler
-from storage.db import Database
-from analytics.arbitrage import ArbitrageDetector, print_arbitrage_report
-from normalization.cost_score import print_cost_comparison, compare_providers_by_gpu
 
 
 def fetch_and_analyze():
     """Fetch prices and perform arbitrage analysis."""
+    # Imported here (like uvicorn in start_api) so --api-only doesn't pay
+    # for the scheduler, the six provider modules and the analytics stack
+    from data_collection.scheduler import PricingScheduler
+    from storage.db import Database
+    from analytics.arbitrage import ArbitrageDetector, print_arbitrage_report
+    from normalization.cost_score import print_cost_comparison, compare_providers_by_gpu
+
     print("\n" + "="*70)
     print("GPU COST ARBITRAGE ENGINE")
     print("="*70 + "\n")
@@ -35,21 +38,25 @@ def fetch_and_analyze():
     print(f"✅ Fetched {result['total_prices']} prices from {result['providers_successful']}/{result['providers_queried']} providers")
     print(f"   Elapsed time: {result['elapsed_seconds']}s\n")
 
+    # One canonical list for the whole pipeline: storage, detection and
+    # comparison all take references to it, never copies
+    prices = result['prices']
+
     # Store in database
-    count = db.insert_prices_bulk(result['prices'])
+    count = db.insert_prices_bulk(prices)
     print(f"✅ Stored {count} prices in database\n")
 
     # Detect arbitrage opportunities
     print("Analyzing arbitrage opportunities...\n")
     detector = ArbitrageDetector(min_percentage_savings=10.0)
-    opportunities = detector.detect_opportunities(result['prices'], precision="fp32")
+    opportunities = detector.detect_opportunities(prices, precision="fp32")
 
     # Print report
     print_arbitrage_report(opportunities)
 
     # Show A100 comparison
-    if any(p.get('gpu_model') == 'A100' for p in result['prices']):
-        comparison = compare_providers_by_gpu(result['prices'], 'A100', precision="fp32")
+    if any(p.get('gpu_model') == 'A100' for p in prices):
+        comparison = compare_providers_by_gpu(prices, 'A100', precision="fp32")
         print_cost_comparison(comparison)
 
     print("\n" + "="*70)
@@ -4,13 +4,74 @@ Cost-performance scoring and analysis.
 Provides detailed cost-performance metrics and comparisons.
 """
 
-from typing import Dict, Any, List
+import heapq
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
 from normalization.normalize import normalize_prices
 
+# Memoized normalization results, keyed by (id, len, precision) of the
+# input list - compare_providers_by_gpu/get_top_values re-score the same
+# polling snapshot repeatedly and should only pay for normalization once
+_normalized_cache: Dict[Tuple[int, int, str], List[Dict[str, Any]]] = {}
+_CACHE_MAX_ENTRIES = 8
+
+
+# Per-snapshot GPU-model index, keyed like the normalized cache: scanning
+# many GPU models against one batch costs one pass plus G dict lookups
+# instead of G full-list filters
+_gpu_index_cache: Dict[Tuple[int, int], Dict[str, List[Dict[str, Any]]]] = {}
+
+
+def invalidate_score_cache() -> None:
+    """Clear memoized normalization results (call after prices change in place)."""
+    _normalized_cache.clear()
+    _gpu_index_cache.clear()
+
+
+def build_gpu_index(prices: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group a price batch by gpu_model in a single pass."""
+    index = defaultdict(list)
+    for p in prices:
+        index[p.get('gpu_model')].append(p)
+    return index
+
+
+def _gpu_index_cached(prices: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Build (or reuse) the per-batch gpu_model index."""
+    cache_key = (id(prices), len(prices))
+    index = _gpu_index_cache.get(cache_key)
+    if index is None:
+        index = build_gpu_index(prices)
+        if len(_gpu_index_cache) >= _CACHE_MAX_ENTRIES:
+            _gpu_index_cache.pop(next(iter(_gpu_index_cache)))
+        _gpu_index_cache[cache_key] = index
+    return index
+
+
+def _normalize_cached(
+    prices: List[Dict[str, Any]],
+    precision: str,
+) -> List[Dict[str, Any]]:
+    """Normalize a price batch, reusing the result for repeat calls."""
+    cache_key = (id(prices), len(prices), precision)
+    normalized = _normalized_cache.get(cache_key)
+    if normalized is None:
+        normalized = normalize_prices(prices, precision=precision)
+        if len(_normalized_cache) >= _CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (insertion order)
+            _normalized_cache.pop(next(iter(_normalized_cache)))
+        _normalized_cache[cache_key] = normalized
+    return normalized
+
 
 def calculate_cost_scores(
     prices: List[Dict[str, Any]],
     precision: str = "fp32",
+    top_n: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Calculate comprehensive cost scores for all prices.
@@ -24,12 +85,14 @@ def calculate_cost_scores(
     Args:
         prices: List of price dictionaries
         precision: Precision to use for scoring
+        top_n: Only return the N best options; a heap selection
+            (O(N log k)) replaces the full sort when set
 
     Returns:
         List of prices with cost scores
     """
-    # Normalize prices
-    normalized = normalize_prices(prices, precision=precision)
+    # Normalize prices (memoized per input batch)
+    normalized = _normalize_cached(prices, precision)
 
     if not normalized:
         return []
@@ -40,34 +103,48 @@ def calculate_cost_scores(
     if not scored:
         return normalized
 
-    # Sort by cost-performance score (descending)
-    scored = sorted(
-        scored,
-        key=lambda x: x['cost_performance_score'],
-        reverse=True
-    )
-
-    # Calculate additional metrics
-    best_score = scored[0]['cost_performance_score']
-    worst_score = scored[-1]['cost_performance_score']
-
+    score_key = itemgetter('cost_performance_score')
+
+    if top_n is not None and top_n < len(scored):
+        # Best/worst come from the full batch (pre-truncation) so the
+        # relative metrics keep the same meaning as a full ranking
+        all_scores = np.fromiter(
+            map(score_key, scored), dtype=np.float64, count=len(scored)
+        )
+        best_score = float(all_scores.max())
+        worst_score = float(all_scores.min())
+        # Heap selection keeps only the k winners: O(N log k) vs O(N log N)
+        scored = heapq.nlargest(top_n, scored, key=score_key)
+        scores = np.fromiter(
+            map(score_key, scored), dtype=np.float64, count=len(scored)
+        )
+    else:
+        # Sort by cost-performance score (descending)
+        scored = sorted(scored, key=score_key, reverse=True)
+        scores = np.fromiter(
+            map(score_key, scored), dtype=np.float64, count=len(scored)
+        )
+        best_score = scores[0]
+        worst_score = scores[-1]
+
+    # Calculate additional metrics: one vectorized expression per metric
+    # instead of divisions and rounding per element in Python
+
+    if worst_score > 0:
+        savings = np.round((scores - worst_score) / worst_score * 100, 2).tolist()
+    else:
+        savings = [0] * len(scored)
+
+    if best_score > 0:
+        relative = np.round(scores / best_score * 100, 2).tolist()
+    else:
+        relative = [0] * len(scored)
+
+    # Zip the computed arrays back into the dicts (assignments only)
     for idx, price in enumerate(scored):
-        # Value rank (1 is best)
-        price['value_rank'] = idx + 1
-
-        # Savings vs worst option
-        if worst_score > 0:
-            savings = ((price['cost_performance_score'] - worst_score) / worst_score) * 100
-            price['savings_vs_worst_percent'] = round(savings, 2)
-        else:
-            price['savings_vs_worst_percent'] = 0
-
-        # Relative value score (0-100 scale)
-        if best_score > 0:
-            relative_value = (price['cost_performance_score'] / best_score) * 100
-            price['relative_value_score'] = round(relative_value, 2)
-        else:
-            price['relative_value_score'] = 0
+        price['value_rank'] = idx + 1  # 1 is best
+        price['savings_vs_worst_percent'] = savings[idx]
+        price['relative_value_score'] = relative[idx]
 
     return scored
 
@@ -88,8 +165,9 @@ def compare_providers_by_gpu(
     Returns:
         Comparison report
     """
-    # Filter to specific GPU
-    gpu_prices = [p for p in prices if p.get('gpu_model') == gpu_model]
+    # Filter to specific GPU via the per-batch index (one pass, reused
+    # across comparisons over the same snapshot)
+    gpu_prices = _gpu_index_cached(prices).get(gpu_model, [])
 
     if not gpu_prices:
         return {
@@ -152,8 +230,7 @@ def get_top_values(
     Returns:
         List of top value options
     """
-    scored = calculate_cost_scores(prices, precision=precision)
-    return scored[:top_n]
+    return calculate_cost_scores(prices, precision=precision, top_n=top_n)
 
 
 def print_cost_comparison(comparison: Dict[str, Any]) -> None:
@@ -16,7 +16,10 @@ Sources:
 - Academic benchmarks
 """
 
-from typing import Dict, Any, Optional
+import functools
+import re
+import types
+from typing import Dict, Any, Optional, Tuple
 
 
 # GPU Specifications Database
@@ -126,10 +129,39 @@ GPU_SPECS = {
 }
 
 
+# Catalog indexed by upper-cased key, built once at import. The direct
+# probe goes through this (so "RTX 6000 ADA" hits even though the raw
+# key is mixed-case) and the partial matcher below resolves into it.
+# Values are read-only views: lookups share one cached object per model,
+# so a caller mutating it would silently corrupt the catalog for
+# everyone else.
+_NORM_SPECS = {k.upper(): types.MappingProxyType(v) for k, v in GPU_SPECS.items()}
+
+# Single-pass partial matcher, compiled once at import: the alternation
+# lists keys longest-first so "A100-40GB PCIE" resolves to the 40GB SKU
+# rather than whichever shorter key happens to come first in the dict.
+# One C-level scan of the query replaces a substring test per catalog key.
+_PARTIAL_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_NORM_SPECS, key=len, reverse=True))
+)
+
+# Fast reject for noise queries ("unknown", "cpu-only", ...): every
+# catalog key contains a digit, so a digit-free query cannot contain
+# any of them and skips the partial scan entirely. isdisjoint is one
+# C-level pass. Guarded at import in case a digit-free SKU is ever added.
+_DIGITS = frozenset('0123456789')
+_ALL_KEYS_HAVE_DIGITS = all(not _DIGITS.isdisjoint(k) for k in _NORM_SPECS)
+
+
+@functools.lru_cache(maxsize=2048)
 def get_gpu_specs(gpu_model: str) -> Optional[Dict[str, Any]]:
     """
     Get specifications for a GPU model.
 
+    Results are memoized per model string: the normalization loops ask
+    for the same handful of models thousands of times, and the fallback
+    substring scan only ever runs once per distinct name.
+
     Args:
         gpu_model: GPU model name (e.g., "A100", "RTX 4090")
 
@@ -139,22 +171,33 @@ def get_gpu_specs(gpu_model: str) -> Optional[Dict[str, Any]]:
     # Normalize model name
     normalized = gpu_model.upper().strip()
 
-    # Direct lookup
-    if normalized in GPU_SPECS:
-        return GPU_SPECS[normalized]
+    # Direct lookup against the normalized index (one dict probe, no
+    # per-call casing of the catalog keys)
+    specs = _NORM_SPECS.get(normalized)
+    if specs is not None:
+        return specs
 
-    # Try partial matching (e.g., "A100 80GB" -> "A100")
-    for spec_name in GPU_SPECS:
-        if spec_name in normalized:
-            return GPU_SPECS[spec_name]
+    # Fast reject before the partial scan: no digit means no match
+    if _ALL_KEYS_HAVE_DIGITS and _DIGITS.isdisjoint(normalized):
+        return None
+
+    # Try partial matching (e.g., "A100 80GB" -> "A100"): one pass over
+    # the query via the precompiled alternation, longest key wins
+    match = _PARTIAL_RE.search(normalized)
+    if match:
+        return _NORM_SPECS[match.group()]
 
     # Not found
     return None
 
 
-def get_all_gpu_models() -> list:
-    """Get list of all supported GPU models."""
-    return list(GPU_SPECS.keys())
+# Built once: callers iterate or take len(), neither needs a fresh list
+_ALL_MODELS = tuple(GPU_SPECS)
+
+
+def get_all_gpu_models() -> Tuple[str, ...]:
+    """Get all supported GPU models (shared immutable tuple)."""
+    return _ALL_MODELS
 
 
 def get_tflops(gpu_model: str, precision: str = "fp32") -> Optional[float]:
@@ -194,12 +237,15 @@ def compare_gpus(gpu1: str, gpu2: str, precision: str = "fp32") -> Dict[str, Any
     if not specs1 or not specs2:
         return {"error": "One or both GPU models not found"}
 
-    tflops1 = get_tflops(gpu1, precision) or 0
-    tflops2 = get_tflops(gpu2, precision) or 0
+    key = f"tflops_{precision.lower()}"
+    tflops1 = specs1.get(key) or 0
+    tflops2 = specs2.get(key) or 0
 
+    # Compute the slower value once instead of two min() calls
     faster_gpu = gpu1 if tflops1 > tflops2 else gpu2
+    slower = tflops2 if tflops1 > tflops2 else tflops1
     performance_diff = abs(tflops1 - tflops2)
-    percentage_diff = (performance_diff / min(tflops1, tflops2)) * 100 if min(tflops1, tflops2) > 0 else 0
+    percentage_diff = (performance_diff / slower) * 100 if slower > 0 else 0
 
     return {
         "gpu1": {
@@ -7,8 +7,45 @@ Normalizes prices across providers for fair comparison by factoring in:
 - Memory
 """
 
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
-from normalization.gpu_specs import get_gpu_specs, get_tflops
+
+import numpy as np
+
+from normalization.gpu_specs import get_gpu_specs
+
+try:
+    import numba
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+def _normalize_core(
+    price_per_hour: float,
+    availability: float,
+    tflops: float,
+    include_availability: bool,
+):
+    """
+    Numeric core of the scalar normalization: (cost_per_tflop, score).
+
+    Pure float arithmetic with no dict access, so the optional numba
+    build compiles it to a C-level function for one-at-a-time ingest;
+    the batch path stays on the NumPy ufuncs.
+    """
+    cost_per_tflop = price_per_hour / tflops
+    if price_per_hour > 0:
+        score = tflops / price_per_hour
+        if include_availability:
+            score *= availability
+    else:
+        score = 0.0
+    return cost_per_tflop, score
+
+
+if _HAVE_NUMBA:
+    _normalize_core = numba.njit(cache=True, fastmath=True)(_normalize_core)
 
 
 def normalize_price(
@@ -40,7 +77,9 @@ def normalize_price(
         price['cost_performance_score'] = None
         return price
 
-    tflops = get_tflops(gpu_model, precision)
+    # Read the tflops field off the cached specs directly rather than
+    # paying a second get_gpu_specs lookup through get_tflops
+    tflops = specs.get(f"tflops_{precision.lower()}")
     if not tflops or tflops == 0:
         price['normalized'] = False
         return price
@@ -48,16 +87,12 @@ def normalize_price(
     price_per_hour = price.get('price_per_hour', 0)
     availability = price.get('availability', 1.0)
 
-    # Calculate cost per TFLOPs (lower is better)
-    cost_per_tflop = price_per_hour / tflops
-
-    # Calculate cost-performance score
-    # Score = (TFLOPs / price) * availability
-    # Higher score = better value
-    if include_availability:
-        cost_performance_score = (tflops / price_per_hour) * availability if price_per_hour > 0 else 0
-    else:
-        cost_performance_score = (tflops / price_per_hour) if price_per_hour > 0 else 0
+    # Cost per TFLOPs (lower is better) and cost-performance score
+    # ((TFLOPs / price) * availability, higher is better) computed in
+    # the jittable numeric core
+    cost_per_tflop, cost_performance_score = _normalize_core(
+        price_per_hour, availability, tflops, include_availability
+    )
 
     # Add normalized fields
     price['normalized'] = True
@@ -69,6 +104,61 @@ def normalize_price(
     return price
 
 
+def make_normalizer(
+    precision: str = "fp32",
+    include_availability: bool = True,
+):
+    """
+    Build a single-row normalizer specialized for fixed parameters.
+
+    The tflops field name is formatted once here instead of per call,
+    and the parameters are closed over as cell loads rather than
+    re-passed — useful for live ingest loops that normalize one row at
+    a time with the same settings. Behaves exactly like
+    normalize_price(price, precision, include_availability).
+
+    Returns:
+        Callable taking one price dict, returning it normalized (or
+        None when gpu_model is missing)
+    """
+    tflops_key = f"tflops_{precision.lower()}"
+
+    def normalize(price: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        gpu_model = price.get('gpu_model')
+        if not gpu_model:
+            return None
+
+        specs = get_gpu_specs(gpu_model)
+        if not specs:
+            price['normalized'] = False
+            price['tflops'] = None
+            price['cost_per_tflop'] = None
+            price['cost_performance_score'] = None
+            return price
+
+        tflops = specs.get(tflops_key)
+        if not tflops:
+            price['normalized'] = False
+            return price
+
+        cost_per_tflop, cost_performance_score = _normalize_core(
+            price.get('price_per_hour', 0),
+            price.get('availability', 1.0),
+            tflops,
+            include_availability,
+        )
+
+        price['normalized'] = True
+        price['tflops'] = round(tflops, 2)
+        price['cost_per_tflop'] = round(cost_per_tflop, 4)
+        price['cost_performance_score'] = round(cost_performance_score, 4)
+        price['precision'] = precision
+
+        return price
+
+    return normalize
+
+
 def normalize_prices(
     prices: List[Dict[str, Any]],
     precision: str = "fp32",
@@ -82,17 +172,92 @@ def normalize_prices(
         precision: Precision to use for performance
         include_availability: Whether to factor availability into score
 
+    The batch path is vectorized: each distinct gpu_model is resolved
+    through the spec database once, the per-row arithmetic runs as NumPy
+    ufuncs over SoA arrays, and the results are zipped back into the
+    dicts. Output matches normalize_price row for row.
+
     Returns:
         List of normalized price dictionaries
     """
+    if not prices:
+        return []
+
+    # Resolve each distinct model once instead of twice per row
+    model_tflops: Dict[str, tuple] = {}
+    for price in prices:
+        model = price.get('gpu_model')
+        if model and model not in model_tflops:
+            specs = get_gpu_specs(model)
+            model_tflops[model] = (
+                specs is not None,
+                specs.get(f"tflops_{precision.lower()}") if specs else None,
+            )
+
     normalized = []
+    vec_rows = []
+    vec_tflops = []
+
     for price in prices:
-        norm_price = normalize_price(price, precision, include_availability)
-        if norm_price:
-            normalized.append(norm_price)
+        model = price.get('gpu_model')
+        if not model:
+            continue
+        known, tflops = model_tflops[model]
+        if not known:
+            # Unknown GPU, return original price without normalization
+            price['normalized'] = False
+            price['tflops'] = None
+            price['cost_per_tflop'] = None
+            price['cost_performance_score'] = None
+        elif not tflops:
+            price['normalized'] = False
+        else:
+            vec_rows.append(price)
+            vec_tflops.append(tflops)
+        normalized.append(price)
+
+    if vec_rows:
+        n = len(vec_rows)
+        tflops_arr = np.fromiter(vec_tflops, dtype=np.float64, count=n)
+        price_arr = np.fromiter(
+            (p.get('price_per_hour', 0) for p in vec_rows), dtype=np.float64, count=n
+        )
+        avail_arr = np.fromiter(
+            (p.get('availability', 1.0) for p in vec_rows), dtype=np.float64, count=n
+        )
+
+        cost_per_tflop = np.round(price_arr / tflops_arr, 4).tolist()
+        # Score = (TFLOPs / price) * availability; zero where price is zero
+        with np.errstate(divide='ignore'):
+            score = np.where(price_arr > 0, tflops_arr / price_arr, 0.0)
+        if include_availability:
+            score *= avail_arr
+        score = np.round(score, 4).tolist()
+        tflops_rounded = np.round(tflops_arr, 2).tolist()
+
+        for idx, price in enumerate(vec_rows):
+            price['normalized'] = True
+            price['tflops'] = tflops_rounded[idx]
+            price['cost_per_tflop'] = cost_per_tflop[idx]
+            price['cost_performance_score'] = score[idx]
+            price['precision'] = precision
+
     return normalized
 
 
+# Memoized rankings keyed by (id, len, gpu_model, precision) of the
+# input batch — the same snapshot-identity scheme as the score cache in
+# cost_score.py, so repeat rankings of one polling snapshot skip the
+# normalize-and-sort entirely
+_rank_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+_RANK_CACHE_MAX_ENTRIES = 8
+
+
+def invalidate_rank_cache() -> None:
+    """Clear memoized rankings (call after prices change in place)."""
+    _rank_cache.clear()
+
+
 def rank_by_cost_performance(
     prices: List[Dict[str, Any]],
     gpu_model: Optional[str] = None,
@@ -101,6 +266,9 @@ def rank_by_cost_performance(
     """
     Rank prices by cost-performance score.
 
+    Results are memoized per input batch, so ranking the same snapshot
+    again with the same parameters is a dict probe.
+
     Args:
         prices: List of price dictionaries
         gpu_model: Optional GPU model to filter by
@@ -109,31 +277,70 @@ def rank_by_cost_performance(
     Returns:
         Sorted list (best value first)
     """
-    # Normalize prices
+    cache_key = (id(prices), len(prices), gpu_model, precision)
+    cached = _rank_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Normalize prices (vectorized batch path)
     normalized = normalize_prices(prices, precision=precision)
 
-    # Filter by GPU model if specified
+    # Model filter and null filter fused into one pass
     if gpu_model:
-        normalized = [p for p in normalized if p['gpu_model'] == gpu_model]
-
-    # Filter out prices that couldn't be normalized
-    normalized = [p for p in normalized if p.get('cost_performance_score') is not None]
+        candidates = [
+            p for p in normalized
+            if p['gpu_model'] == gpu_model
+            and p.get('cost_performance_score') is not None
+        ]
+    else:
+        candidates = [p for p in normalized if p.get('cost_performance_score') is not None]
 
-    # Sort by cost-performance score (descending - higher is better)
+    # Sort by cost-performance score (descending - higher is better).
+    # Equal scores tie-break on (provider, gpu_model) so the ranking is
+    # deterministic regardless of how the input batch was assembled,
+    # not just stable within one input order. The key tuple is built
+    # once per row (sort key semantics), not per comparison.
     ranked = sorted(
-        normalized,
-        key=lambda x: x['cost_performance_score'],
-        reverse=True
+        candidates,
+        key=lambda p: (-p['cost_performance_score'], p['provider'], p['gpu_model']),
     )
 
+    if len(_rank_cache) >= _RANK_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry (insertion order)
+        _rank_cache.pop(next(iter(_rank_cache)))
+    _rank_cache[cache_key] = ranked
+
     return ranked
 
 
+def build_gpu_index(prices: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Index price rows by gpu_model in one O(N) pass.
+
+    Callers issuing several per-model queries against the same snapshot
+    can build this once and pass it via the index parameter, turning
+    each full-list scan into a dict probe.
+
+    Args:
+        prices: List of price dictionaries
+
+    Returns:
+        Mapping of gpu_model to its price rows
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for price in prices:
+        model = price.get('gpu_model')
+        if model:
+            index.setdefault(model, []).append(price)
+    return index
+
+
 def find_best_value(
     prices: List[Dict[str, Any]],
     gpu_model: Optional[str] = None,
     min_availability: float = 0.0,
     precision: str = "fp32",
+    index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Find the best value GPU across all providers.
@@ -143,18 +350,30 @@ def find_best_value(
         gpu_model: Optional GPU model to filter by
         min_availability: Minimum availability threshold
         precision: Precision to use for comparison
+        index: Optional build_gpu_index(prices) result; with gpu_model
+            set, restricts work to that model's rows without scanning
 
     Returns:
         Best value price entry or None
     """
-    # Rank by cost-performance
-    ranked = rank_by_cost_performance(prices, gpu_model, precision)
-
-    # Filter by minimum availability
-    ranked = [p for p in ranked if p.get('availability', 0) >= min_availability]
+    # With a pre-built index the candidate pool is one dict probe; the
+    # model filter below then has nothing left to reject
+    if gpu_model and index is not None:
+        prices = index.get(gpu_model, [])
 
-    # Return best
-    return ranked[0] if ranked else None
+    # One O(N) max over a fused filter generator: sorting the whole
+    # batch to take element [0] was O(N log N) plus two list copies
+    normalized = normalize_prices(prices, precision=precision)
+    return max(
+        (
+            p for p in normalized
+            if (not gpu_model or p['gpu_model'] == gpu_model)
+            and p.get('cost_performance_score') is not None
+            and p.get('availability', 0) >= min_availability
+        ),
+        key=itemgetter('cost_performance_score'),
+        default=None,
+    )
 
 
 def get_performance_tiers(
@@ -185,16 +404,21 @@ def get_performance_tiers(
         'unknown': [],
     }
 
-    for price in normalized:
-        tflops = price.get('tflops')
+    if not normalized:
+        return tiers
 
-        if tflops is None:
-            tiers['unknown'].append(price)
-        elif tflops >= 50:
-            tiers['high_end'].append(price)
-        elif tflops >= 15:
-            tiers['mid_range'].append(price)
-        else:
-            tiers['entry'].append(price)
+    # One vectorized binning pass instead of two Python comparisons per
+    # row; unknown (None) tflops are masked out before digitize since
+    # NaN would otherwise sort into the top bucket
+    tflops_arr = np.array(
+        [p.get('tflops') if p.get('tflops') is not None else np.nan for p in normalized],
+        dtype=np.float64,
+    )
+    unknown = np.isnan(tflops_arr)
+    bins = np.digitize(tflops_arr, (15.0, 50.0))
+
+    tier_names = ('entry', 'mid_range', 'high_end')
+    for price, bucket, unk in zip(normalized, bins.tolist(), unknown.tolist()):
+        tiers['unknown' if unk else tier_names[bucket]].append(price)
 
     return tiers
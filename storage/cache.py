@@ -6,18 +6,26 @@ Production mapping:
 - GCP: Cloud Memorystore (Redis)
 - Azure: Azure Cache for Redis
 
-For this project: Simple in-memory cache with TTL
+For this project: Simple in-memory LRU cache with TTL
 """
 
+import heapq
 import time
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import threading
 
 
 class PriceCache:
     """
-    Simple in-memory cache for GPU prices with TTL support.
+    Simple in-memory LRU cache for GPU prices with TTL support.
+
+    Entries are (expires_at, value) tuples stamped with time.monotonic()
+    — one float compare per hit instead of datetime construction — kept
+    in an OrderedDict capped at max_size, evicting least recently used.
+    A min-heap of (expires_at, key) makes cleanup_expired O(k log n) in
+    the number of expired entries instead of a full O(n) sweep; stale
+    heap tuples (re-set or already-deleted keys) are skipped lazily.
 
     In production, this would be replaced with Redis:
     - redis-py client
@@ -26,36 +34,37 @@ class PriceCache:
     - Pub/Sub for cache invalidation
     """
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: int = 300, max_size: int = 1024):
         """
         Initialize cache.
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default 5 minutes)
+            max_size: Maximum number of entries before LRU eviction
         """
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._expiry_heap: list = []
         self._lock = threading.Lock()
 
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
-        """Check if a cache entry is expired."""
-        expires_at = entry['expires_at']
-        return datetime.utcnow() > expires_at
-
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
         """
         Set a cache entry.
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl_seconds: Per-entry TTL override (defaults to the cache TTL)
         """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
         with self._lock:
-            self._cache[key] = {
-                'value': value,
-                'expires_at': datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
-                'created_at': datetime.utcnow(),
-            }
+            expires_at = time.monotonic() + ttl
+            self._cache[key] = (expires_at, value)
+            self._cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -68,16 +77,16 @@ class PriceCache:
             Cached value or None if not found/expired
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
 
-            entry = self._cache[key]
-
-            if self._is_expired(entry):
+            if entry[0] < time.monotonic():
                 del self._cache[key]
                 return None
 
-            return entry['value']
+            self._cache.move_to_end(key)
+            return entry[1]
 
     def delete(self, key: str) -> bool:
         """
@@ -99,6 +108,7 @@ class PriceCache:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
 
     def cleanup_expired(self) -> int:
         """
@@ -108,15 +118,21 @@ class PriceCache:
             Number of entries removed
         """
         with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if self._is_expired(entry)
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-
-            return len(expired_keys)
+            now = time.monotonic()
+            heap = self._expiry_heap
+            removed = 0
+
+            # Pop only entries whose deadline has passed; a popped tuple
+            # is stale (and skipped) if its key was deleted or re-set
+            # with a newer deadline since it was pushed
+            while heap and heap[0][0] < now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] == expires_at:
+                    del self._cache[key]
+                    removed += 1
+
+            return removed
 
     def stats(self) -> Dict[str, Any]:
         """
@@ -126,14 +142,16 @@ class PriceCache:
             Dictionary with cache stats
         """
         with self._lock:
+            now = time.monotonic()
             total = len(self._cache)
-            expired = sum(1 for entry in self._cache.values() if self._is_expired(entry))
+            expired = sum(1 for entry in self._cache.values() if entry[0] < now)
 
             return {
                 'total_entries': total,
                 'active_entries': total - expired,
                 'expired_entries': expired,
                 'ttl_seconds': self.ttl_seconds,
+                'max_size': self.max_size,
             }
 
     def __repr__(self) -> str:
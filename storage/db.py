@@ -11,11 +11,25 @@ For this project: SQLite with simple interface
 
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+import threading
+import time
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Optional
 from storage.models import GPUPrice
 
 
+def _utc_iso(ts: Optional[float] = None) -> str:
+    """
+    Format a unix time (default: now) as ISO8601 UTC with 'Z' suffix.
+
+    time.strftime over gmtime skips the datetime/timedelta object churn
+    of the old per-query construction. ISO8601 'Z' strings compare
+    lexicographically in timestamp order, so the TEXT column's range
+    scans stay correct.
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(ts))
+
+
 class Database:
     """SQLite database interface for GPU pricing."""
 
@@ -27,14 +41,46 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.conn = None
+        self._local = threading.local()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection pragmas applied."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+
+        cursor = conn.cursor()
+
+        # WAL lets readers proceed while insert_prices_bulk writes;
+        # NORMAL syncs once per checkpoint instead of per commit, and
+        # mmap serves reads straight from the page cache. Temp structures
+        # and a 64MB page cache stay in memory. journal_mode sticks to
+        # the database file; the rest are per-connection settings
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """
+        This thread's connection, opened lazily.
+
+        One connection per thread (instead of one shared with
+        check_same_thread=False) lets WAL-mode readers run concurrently
+        with the writer rather than serializing on a single handle.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
     def _init_db(self):
         """Initialize database schema."""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-
         cursor = self.conn.cursor()
 
         # Create providers table
@@ -82,24 +128,37 @@ class Database:
             ON gpu_prices(timestamp)
         """)
 
+        # Composite indexes serve the history queries (equality on
+        # gpu_model/provider + timestamp range, newest first) with a
+        # prefix seek and no sort step; their prefixes also cover plain
+        # equality filters, so the old single-column gpu_model/provider
+        # indexes are dropped to save write amplification
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_gpu_prices_gpu_model
-            ON gpu_prices(gpu_model)
+            CREATE INDEX IF NOT EXISTS idx_gpu_prices_gpu_time
+            ON gpu_prices(gpu_model, timestamp DESC)
         """)
 
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_gpu_prices_provider
-            ON gpu_prices(provider)
+            CREATE INDEX IF NOT EXISTS idx_gpu_prices_provider_ts
+            ON gpu_prices(provider, timestamp DESC)
         """)
 
+        cursor.execute("DROP INDEX IF EXISTS idx_gpu_prices_gpu_model")
+        cursor.execute("DROP INDEX IF EXISTS idx_gpu_prices_provider")
+
+        # Refresh planner statistics so the composite indexes get picked
+        cursor.execute("ANALYZE")
+
         self.conn.commit()
 
-    def insert_price(self, price: Dict[str, Any]) -> int:
+    def insert_price(self, price: Dict[str, Any], commit: bool = True) -> int:
         """
         Insert a single price entry.
 
         Args:
             price: Price dictionary
+            commit: Commit immediately; pass False when feeding a stream
+                of rows so one commit (and one fsync) covers them all
 
         Returns:
             ID of inserted row
@@ -120,9 +179,10 @@ class Database:
             price.get('gpu_count', 1),
             price.get('memory_gb'),
             price['timestamp'],
-            datetime.utcnow().isoformat() + 'Z',
+            _utc_iso(),
         ))
-        self.conn.commit()
+        if commit:
+            self.conn.commit()
         return cursor.lastrowid
 
     def insert_prices_bulk(self, prices: List[Dict[str, Any]]) -> int:
@@ -135,10 +195,12 @@ class Database:
         Returns:
             Number of rows inserted
         """
-        cursor = self.conn.cursor()
-        created_at = datetime.utcnow().isoformat() + 'Z'
+        created_at = _utc_iso()
 
-        rows = [
+        # Generator feeds executemany row by row (no intermediate list),
+        # and the explicit transaction below covers the whole batch so
+        # SQLite fsyncs once instead of per row
+        rows = (
             (
                 p['provider'],
                 p['region'],
@@ -152,17 +214,47 @@ class Database:
                 created_at,
             )
             for p in prices
-        ]
+        )
+
+        # BEGIN IMMEDIATE takes the write lock up front, so under
+        # contention the batch queues deterministically instead of
+        # failing mid-transaction on lock upgrade
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("""
+                INSERT INTO gpu_prices (
+                    provider, region, gpu_model, price_per_hour, availability,
+                    instance_type, gpu_count, memory_gb, timestamp, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        return len(prices)
+
+    def insert_prices_stream(self, prices: Iterable[Dict[str, Any]], chunk: int = 1000) -> int:
+        """
+        Insert prices from an iterable without materializing it.
 
-        cursor.executemany("""
-            INSERT INTO gpu_prices (
-                provider, region, gpu_model, price_per_hour, availability,
-                instance_type, gpu_count, memory_gb, timestamp, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, rows)
+        Rows are consumed chunk at a time, each chunk written by one
+        executemany inside one transaction, so arbitrarily long streams
+        insert with bounded memory and one fsync per chunk.
 
-        self.conn.commit()
-        return len(rows)
+        Args:
+            prices: Iterable of price dictionaries
+            chunk: Rows per transaction
+
+        Returns:
+            Number of rows inserted
+        """
+        it = iter(prices)
+        inserted = 0
+        while batch := list(islice(it, chunk)):
+            inserted += self.insert_prices_bulk(batch)
+        return inserted
 
     def get_latest_prices(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -183,6 +275,54 @@ class Database:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_latest_prices_iter(self, limit: int = 100) -> Iterable[Dict[str, Any]]:
+        """
+        Stream the most recent price entries.
+
+        Rows come straight off the cursor one at a time — no fetchall
+        materialization and no second list — so large reads run at
+        constant memory. Callers that need a list wrap it in list().
+
+        Args:
+            limit: Maximum number of entries to yield
+
+        Yields:
+            Price dictionaries, newest first
+        """
+        cursor = self.conn.execute("""
+            SELECT * FROM gpu_prices
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (limit,))
+
+        for row in cursor:
+            yield dict(row)
+
+    def get_prices_by_gpu_iter(self, gpu_model: str, hours: int = 24) -> Iterable[Dict[str, Any]]:
+        """
+        Stream prices for a specific GPU model within time range.
+
+        Generator counterpart of get_prices_by_gpu; see
+        get_latest_prices_iter for the memory rationale.
+
+        Args:
+            gpu_model: GPU model name (e.g., "A100")
+            hours: Hours of history to yield
+
+        Yields:
+            Price dictionaries, newest first
+        """
+        cutoff_time = _utc_iso(time.time() - hours * 3600)
+
+        cursor = self.conn.execute("""
+            SELECT * FROM gpu_prices
+            WHERE gpu_model = ? AND timestamp >= ?
+            ORDER BY timestamp DESC
+        """, (gpu_model, cutoff_time))
+
+        for row in cursor:
+            yield dict(row)
+
     def get_prices_by_gpu(self, gpu_model: str, hours: int = 24) -> List[Dict[str, Any]]:
         """
         Get prices for a specific GPU model within time range.
@@ -195,7 +335,7 @@ class Database:
             List of price dictionaries
         """
         cursor = self.conn.cursor()
-        cutoff_time = (datetime.utcnow() - timedelta(hours=hours)).isoformat() + 'Z'
+        cutoff_time = _utc_iso(time.time() - hours * 3600)
 
         cursor.execute("""
             SELECT * FROM gpu_prices
@@ -217,7 +357,7 @@ class Database:
             List of price dictionaries
         """
         cursor = self.conn.cursor()
-        cutoff_time = (datetime.utcnow() - timedelta(hours=hours)).isoformat() + 'Z'
+        cutoff_time = _utc_iso(time.time() - hours * 3600)
 
         cursor.execute("""
             SELECT * FROM gpu_prices
@@ -261,21 +401,42 @@ class Database:
         Returns:
             Number of rows deleted
         """
-        cursor = self.conn.cursor()
-        cutoff_time = (datetime.utcnow() - timedelta(days=days)).isoformat() + 'Z'
-
-        cursor.execute("""
-            DELETE FROM gpu_prices
-            WHERE timestamp < ?
-        """, (cutoff_time,))
-
-        self.conn.commit()
-        return cursor.rowcount
+        cutoff_time = _utc_iso(time.time() - days * 86400)
+        conn = self.conn
+        deleted = 0
+
+        # Delete in bounded chunks, committing between them: one giant
+        # DELETE holds the write lock for the whole cleanup and grows
+        # the WAL, while 10k-row slices let readers and the checkpointer
+        # interleave
+        while True:
+            cursor = conn.execute("""
+                DELETE FROM gpu_prices
+                WHERE id IN (
+                    SELECT id FROM gpu_prices
+                    WHERE timestamp < ?
+                    LIMIT 10000
+                )
+            """, (cutoff_time,))
+            conn.commit()
+
+            if cursor.rowcount == 0:
+                return deleted
+            deleted += cursor.rowcount
 
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        """
+        Close the calling thread's connection.
+
+        sqlite3 connections can only be closed from the thread that
+        opened them, so each worker that used the database closes its
+        own handle (daemonized pool threads otherwise drop theirs at
+        process exit, which WAL tolerates).
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     def __enter__(self):
         """Context manager entry."""
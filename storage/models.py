@@ -9,6 +9,7 @@ Production mapping:
 For this project: SQLite for simplicity
 """
 
+import time
 from datetime import datetime
 from typing import Dict, Any
 
@@ -74,7 +75,20 @@ class GPUPrice:
         self.instance_type = instance_type
         self.gpu_count = gpu_count
         self.memory_gb = memory_gb
-        self.timestamp = timestamp or datetime.utcnow().isoformat() + 'Z'
+        # Stamped lazily: bulk constructors shouldn't pay a clock read
+        # and an isoformat per instance when the caller never reads it
+        self._timestamp = timestamp
+
+    @property
+    def timestamp(self) -> str:
+        """ISO8601 timestamp, stamped with the current time on first read."""
+        if self._timestamp is None:
+            self._timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: str) -> None:
+        self._timestamp = value
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GPUPrice':
@@ -12,7 +12,12 @@ Validation criteria:
 ✅ All required fields present
 """
 
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
 from data_collection.providers import (
     AWSProvider,
     GCPProvider,
@@ -23,67 +28,91 @@ from data_collection.providers import (
 )
 
 
-def validate_schema(prices, provider_name):
-    """Validate that all prices match the required schema."""
-    required_fields = ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+# Hoisted once: the list keeps column order for DataFrame selection,
+# the frozenset makes the per-row membership check one C-level set
+# difference against the dict's key view
+_REQUIRED_FIELDS = ['provider', 'region', 'gpu_model', 'price_per_hour', 'availability', 'timestamp']
+_REQUIRED = frozenset(_REQUIRED_FIELDS)
 
-    for idx, price in enumerate(prices):
-        missing = [f for f in required_fields if f not in price]
-        if missing:
-            print(f"❌ {provider_name}: Entry {idx} missing fields: {missing}")
-            return False
 
-        # Validate data types
-        if not isinstance(price['price_per_hour'], (int, float)):
-            print(f"❌ {provider_name}: price_per_hour must be numeric")
-            return False
+def validate_schema(prices, provider_name, out=sys.stdout):
+    """
+    Validate that all prices match the required schema.
 
-        if not (0 <= price['availability'] <= 1):
-            print(f"❌ {provider_name}: availability must be between 0 and 1")
-            return False
+    The happy path is one vectorized pass over a DataFrame (column
+    superset, numeric dtype, availability range); the per-row loop only
+    runs on failure to name the first offending entry.
+    """
+    required_fields = _REQUIRED_FIELDS
+
+    df = pd.DataFrame(prices)
+
+    # A field absent from every row never becomes a column; a field
+    # absent from some rows shows up as NaN
+    if not _REQUIRED.issubset(df.columns) or df[required_fields].isna().any().any():
+        for idx, price in enumerate(prices):
+            missing = _REQUIRED - price.keys()
+            if missing:
+                print(f"❌ {provider_name}: Entry {idx} missing fields: {sorted(missing)}", file=out)
+                return False
+
+    if not pd.api.types.is_numeric_dtype(df['price_per_hour']):
+        print(f"❌ {provider_name}: price_per_hour must be numeric", file=out)
+        return False
+
+    availability_ok = df['availability'].between(0, 1)
+    if not availability_ok.all():
+        idx = int(df.index[~availability_ok][0])
+        print(f"❌ {provider_name}: Entry {idx}: availability must be between 0 and 1", file=out)
+        return False
 
     return True
 
 
-def test_provider(ProviderClass, name):
-    """Test a single provider."""
-    print(f"\n{'='*70}")
-    print(f"TESTING {name.upper()}")
-    print(f"{'='*70}\n")
+def test_provider(ProviderClass, name, out=sys.stdout):
+    """
+    Test a single provider.
+
+    Output goes to `out` so parallel runs can buffer into a StringIO
+    and flush atomically instead of interleaving banners.
+    """
+    print(f"\n{'='*70}", file=out)
+    print(f"TESTING {name.upper()}", file=out)
+    print(f"{'='*70}\n", file=out)
 
     try:
         provider = ProviderClass(use_mock=True)
         prices = provider.get_prices()
 
         if not prices:
-            print(f"❌ {name}: No prices returned")
+            print(f"❌ {name}: No prices returned", file=out)
             return False
 
-        print(f"✅ Fetched {len(prices)} price entries")
+        print(f"✅ Fetched {len(prices)} price entries", file=out)
 
         # Validate schema
-        if not validate_schema(prices, name):
+        if not validate_schema(prices, name, out):
             return False
-        print(f"✅ Schema validation passed")
+        print(f"✅ Schema validation passed", file=out)
 
         # Show sample output
-        print(f"\nSample entries (showing 2/{len(prices)}):")
-        print("-" * 70)
+        print(f"\nSample entries (showing 2/{len(prices)}):", file=out)
+        print("-" * 70, file=out)
         for price in prices[:2]:
-            print(f"  Provider:     {price['provider']}")
-            print(f"  Region:       {price['region']}")
-            print(f"  GPU Model:    {price['gpu_model']}")
-            print(f"  Price/hour:   ${price['price_per_hour']:.2f}")
-            print(f"  Availability: {price['availability']:.0%}")
-            print(f"  Timestamp:    {price['timestamp']}")
-            print("-" * 70)
+            print(f"  Provider:     {price['provider']}", file=out)
+            print(f"  Region:       {price['region']}", file=out)
+            print(f"  GPU Model:    {price['gpu_model']}", file=out)
+            print(f"  Price/hour:   ${price['price_per_hour']:.2f}", file=out)
+            print(f"  Availability: {price['availability']:.0%}", file=out)
+            print(f"  Timestamp:    {price['timestamp']}", file=out)
+            print("-" * 70, file=out)
 
         return True
 
     except Exception as e:
-        print(f"❌ {name}: Error - {e}")
+        print(f"❌ {name}: Error - {e}", file=out)
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=out)
         return False
 
 
@@ -102,16 +131,28 @@ def main():
         (LambdaProvider, "Lambda Labs"),
     ]
 
+    # The six tests are independent I/O-bound fetches: fan out across a
+    # thread pool so wall time is the slowest provider, not the sum.
+    # Each worker writes into its own buffer, flushed in provider order
+    # so the report stays readable
     results = {}
-    for ProviderClass, name in providers:
-        results[name] = test_provider(ProviderClass, name)
+    buffers = {name: io.StringIO() for _, name in providers}
+    with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+        futures = {
+            name: executor.submit(test_provider, ProviderClass, name, buffers[name])
+            for ProviderClass, name in providers
+        }
+        for _, name in providers:
+            results[name] = futures[name].result()
+            sys.stdout.write(buffers[name].getvalue())
 
     # Summary
     print("\n" + "="*70)
     print("VALIDATION SUMMARY")
     print("="*70 + "\n")
 
-    passed = sum(1 for r in results.values() if r)
+    # bool is int: True sums as 1, no generator filter needed
+    passed = sum(results.values())
     total = len(results)
 
     for name, result in results.items():
@@ -9,8 +9,12 @@ Tests:
 4. Cache hit test
 """
 
+import hashlib
 import os
 import time
+
+import numpy as np
+
 from storage.db import Database
 from storage.cache import PriceCache, get_cache
 from data_collection.providers import AWSProvider
@@ -55,6 +59,28 @@ def test_database():
     count = db.insert_prices_bulk(prices)
     print(f"✅ Inserted {count} prices in bulk")
 
+    # Test 2b: Bulk insert throughput — 10k rows must land in one
+    # executemany transaction (a per-row-commit path would take seconds)
+    print("\n[Test 2b] Bulk insert 10,000 synthetic rows")
+    synthetic = [
+        {
+            'provider': 'AWS',
+            'region': 'us-east-1',
+            'gpu_model': 'A100',
+            'price_per_hour': 1.0 + (i % 100) * 0.01,
+            'availability': 0.9,
+            'timestamp': '2026-01-11T13:00:00Z',
+        }
+        for i in range(10_000)
+    ]
+    start = time.perf_counter()
+    bulk_count = db.insert_prices_bulk(synthetic)
+    elapsed = time.perf_counter() - start
+    print(f"✅ Inserted {bulk_count} rows in {elapsed*1000:.1f}ms")
+    if elapsed >= 0.2:
+        print(f"❌ Bulk insert too slow ({elapsed*1000:.1f}ms >= 200ms): not batched in one transaction?")
+        return False
+
     # Test 3: Query latest prices
     print("\n[Test 3] Query latest prices")
     latest = db.get_latest_prices(limit=5)
@@ -155,43 +181,81 @@ def test_cache():
         print("❌ Cache clear failed")
         return False
 
+    # Test 6: Expire many entries — cleanup cost follows the number of
+    # expired keys (heap pops), not the total population
+    print("\n[Test 6] Expire 1,000 of 100,000 entries")
+    cache_big = PriceCache(ttl_seconds=300, max_size=200_000)
+    for i in range(99_000):
+        cache_big.set(f'long_{i}', i)
+    for i in range(1_000):
+        cache_big.set(f'short_{i}', i, ttl_seconds=0)
+
+    time.sleep(0.01)
+
+    start = time.perf_counter()
+    removed = cache_big.cleanup_expired()
+    elapsed = time.perf_counter() - start
+
+    if removed != 1_000:
+        print(f"❌ Expected 1,000 expired entries, removed {removed}")
+        return False
+    if cache_big.stats()['total_entries'] != 99_000:
+        print("❌ Cleanup removed live entries")
+        return False
+
+    print(f"✅ Removed {removed} expired entries in {elapsed*1000:.2f}ms "
+          f"(99,000 live entries untouched)")
+
     print("\n✅ Cache tests passed!")
     return True
 
 
+# Cache payload built once at module scope as a structured array: the
+# timing test should measure the cache path, not 1,000 per-run dict and
+# f-string allocations
+_PAYLOAD = np.array(
+    [(f'A100-{i}', 1.0 + i * 0.1) for i in range(1000)],
+    dtype=[('gpu', 'U16'), ('price', 'f4')],
+)
+
+
 def test_cache_hit_performance():
-    """Test cache hit performance (sub-second)."""
+    """Test cache hit performance (sub-millisecond)."""
     print("\n" + "="*70)
     print("TESTING CACHE HIT PERFORMANCE")
     print("="*70 + "\n")
 
     cache = PriceCache(ttl_seconds=300)
 
-    # Simulate expensive database query
-    expensive_data = {
-        'prices': [
-            {'gpu': f'A100-{i}', 'price': 1.0 + i * 0.1}
-            for i in range(1000)
-        ]
-    }
+    # First access (cache miss): the displaced work is real in-process
+    # compute (hashing 1MB), not a sleep — a sleep would only measure
+    # the sleep
+    print("[Test 1] Cache miss (simulated compute)")
+    payload = b'x' * (1024 * 1024)
+    start = time.perf_counter_ns()
+    hashlib.sha256(payload).hexdigest()
+    cache.set('latest_prices', _PAYLOAD)
+    miss_ns = time.perf_counter_ns() - start
+    print(f"✅ Cache miss took {miss_ns/1e6:.3f}ms (simulated compute)")
+
+    # Second access (cache hit): a single get is below the resolution of
+    # time.time() on some platforms (~1ms), so amortize 10,000 hits over
+    # the monotonic nanosecond clock
+    print("\n[Test 2] Cache hit (sub-millisecond, averaged)")
+    reps = 10_000
+    start = time.perf_counter_ns()
+    for _ in range(reps):
+        cached_data = cache.get('latest_prices')
+    hit_ns = (time.perf_counter_ns() - start) / reps
+    print(f"✅ Cache hit took {hit_ns:.0f}ns (averaged over {reps:,} reps)")
+
+    # The cache must hand back the exact stored object, not a copy
+    if cached_data is not _PAYLOAD:
+        print("❌ Cache hit returned wrong object")
+        return False
 
-    # First access (cache miss - simulate DB query)
-    print("[Test 1] Cache miss (simulated DB query)")
-    start = time.time()
-    time.sleep(0.1)  # Simulate DB query delay
-    cache.set('latest_prices', expensive_data)
-    miss_time = time.time() - start
-    print(f"✅ Cache miss took {miss_time*1000:.2f}ms (simulated DB)")
-
-    # Second access (cache hit)
-    print("\n[Test 2] Cache hit (sub-second)")
-    start = time.time()
-    cached_data = cache.get('latest_prices')
-    hit_time = time.time() - start
-    print(f"✅ Cache hit took {hit_time*1000:.3f}ms")
-
-    if hit_time < 0.001:  # Should be sub-millisecond
-        print(f"✅ Cache hit is {miss_time/hit_time:.0f}x faster than DB query")
+    if hit_ns < 1_000_000:  # Should be sub-millisecond
+        print(f"✅ Cache hit is {miss_ns/hit_ns:.0f}x faster than the simulated query")
     else:
         print("⚠️  Cache hit slower than expected")
 
@@ -215,7 +279,8 @@ def main():
     print("VALIDATION SUMMARY")
     print("="*70 + "\n")
 
-    passed = sum(1 for r in results.values() if r)
+    # bool is int: True sums as 1, no generator filter needed
+    passed = sum(results.values())
     total = len(results)
 
     for name, result in results.items():
@@ -12,9 +12,20 @@ Tests:
 import sys
 from data_collection.scheduler import PricingScheduler
 from normalization.gpu_specs import get_gpu_specs, compare_gpus, get_all_gpu_models
-from normalization.normalize import normalize_prices, rank_by_cost_performance, find_best_value
+from normalization.normalize import normalize_prices, rank_by_cost_performance, find_best_value, build_gpu_index, invalidate_rank_cache
 from normalization.cost_score import calculate_cost_scores, compare_providers_by_gpu, print_cost_comparison
 
+# Provider fetch shared across tests: one fan-out instead of one per test
+_RESULT = None
+
+
+def _cached_result():
+    """Fetch prices once and reuse the same result for every test."""
+    global _RESULT
+    if _RESULT is None:
+        _RESULT = PricingScheduler().fetch_all_prices(parallel=True)
+    return _RESULT
+
 
 def test_gpu_specs():
     """Test GPU specifications database."""
@@ -35,6 +46,13 @@ def test_gpu_specs():
         print("❌ A100 specs not found")
         return False
 
+    # Repeated lookups must return the same cached object — the
+    # normalization loops depend on this memoization invariant
+    if get_gpu_specs("A100") is not get_gpu_specs("A100"):
+        print("❌ get_gpu_specs is not memoized")
+        return False
+    print("✅ Repeated lookups share one cached specs object")
+
     # Test 2: Get all GPU models
     print("\n[Test 2] Get all GPU models")
     models = get_all_gpu_models()
@@ -64,10 +82,8 @@ def test_normalization():
     print("TESTING PRICE NORMALIZATION")
     print("="*70 + "\n")
 
-    # Get sample prices
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    # Get sample prices (shared fetch)
+    prices = _cached_result()['prices']
 
     print(f"Fetched {len(prices)} prices for normalization\n")
 
@@ -100,9 +116,11 @@ def test_normalization():
         print("❌ Ranking failed")
         return False
 
-    # Test 3: Find best value
+    # Test 3: Find best value, against a pre-built per-model index so
+    # the query is a dict probe rather than a scan of the full batch
     print("\n[Test 3] Find best value for A100")
-    best = find_best_value(prices, gpu_model="A100", precision="fp32")
+    by_gpu = build_gpu_index(prices)
+    best = find_best_value(prices, gpu_model="A100", precision="fp32", index=by_gpu)
 
     if best:
         print(f"✅ Best A100 value:")
@@ -125,10 +143,8 @@ def test_cost_scoring():
     print("TESTING COST-PERFORMANCE SCORING")
     print("="*70 + "\n")
 
-    # Get sample prices
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    # Get sample prices (shared fetch)
+    prices = _cached_result()['prices']
 
     # Test 1: Calculate cost scores
     print("[Test 1] Calculate cost scores")
@@ -170,14 +186,20 @@ def test_consistent_ordering():
     print("TESTING RANKING CONSISTENCY")
     print("="*70 + "\n")
 
-    # Get sample prices
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    # Get sample prices (shared fetch)
+    prices = _cached_result()['prices']
+
+    # Rank twice over the same list — no defensive copies; ranking must
+    # not reorder its input. The cache is invalidated between calls so
+    # the second run is a genuine recompute, not a snapshot-cache hit
+    snapshot = [id(p) for p in prices]
+    ranked1 = rank_by_cost_performance(prices, precision="fp32")
+    invalidate_rank_cache()
+    ranked2 = rank_by_cost_performance(prices, precision="fp32")
 
-    # Rank twice
-    ranked1 = rank_by_cost_performance(prices.copy(), precision="fp32")
-    ranked2 = rank_by_cost_performance(prices.copy(), precision="fp32")
+    if [id(p) for p in prices] != snapshot:
+        print("❌ Ranking mutated the input list")
+        return False
 
     # Compare
     if len(ranked1) != len(ranked2):
@@ -212,7 +234,8 @@ def main():
     print("VALIDATION SUMMARY")
     print("="*70 + "\n")
 
-    passed = sum(1 for r in results.values() if r)
+    # bool is int: True sums as 1, no generator filter needed
+    passed = sum(results.values())
     total = len(results)
 
     for name, result in results.items():
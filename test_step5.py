@@ -11,34 +11,70 @@ Tests:
 
 import sys
 from data_collection.scheduler import PricingScheduler
+import analytics.arbitrage as arbitrage_module
 from analytics.arbitrage import (
     ArbitrageDetector,
+    build_provider_gpu_index,
     find_cross_region_arbitrage,
     calculate_monthly_savings,
     print_arbitrage_report,
 )
+from normalization.normalize import build_gpu_index
+
+# Provider fetch shared across tests: one fan-out instead of one per test
+_RESULT = None
+_INDEXES = None
+
+# One detector shared by every test: construction cost is paid once and
+# its per-snapshot detection cache carries across tests, so repeated
+# scans of the shared fetch are dict probes. The thresholds below are
+# the constructor defaults.
+_DETECTOR = ArbitrageDetector(
+    min_price_difference=0.50,
+    min_percentage_savings=10.0,
+    min_providers=2,
+)
+
+
+def _cached_result():
+    """Fetch prices once and reuse the same result for every test."""
+    global _RESULT
+    if _RESULT is None:
+        _RESULT = PricingScheduler().fetch_all_prices(parallel=True)
+    return _RESULT
+
+
+def _cached_indexes():
+    """
+    Build the per-model and per-(provider, model) indexes once over the
+    shared snapshot; every keyed query below is then a dict probe.
+    """
+    global _INDEXES
+    if _INDEXES is None:
+        prices = _cached_result()['prices']
+        _INDEXES = (build_gpu_index(prices), build_provider_gpu_index(prices))
+    return _INDEXES
 
 
 def test_arbitrage_detection():
-    """Test arbitrage opportunity detection."""
+    """Test arbitrage opportunity detection.
+
+    Returns (passed, opportunities) so main() can reuse the computed
+    opportunities for the final report instead of re-detecting.
+    """
     print("\n" + "="*70)
     print("TESTING ARBITRAGE DETECTION")
     print("="*70 + "\n")
 
-    # Get prices
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
+    # Get prices (shared fetch)
+    result = _cached_result()
     prices = result['prices']
 
     print(f"Analyzing {len(prices)} prices from {result['providers_successful']} providers\n")
 
     # Test 1: Detect opportunities with default thresholds
     print("[Test 1] Detect arbitrage opportunities (>10% savings)")
-    detector = ArbitrageDetector(
-        min_price_difference=0.50,
-        min_percentage_savings=10.0,
-        min_providers=2,
-    )
+    detector = _DETECTOR
 
     opportunities = detector.detect_opportunities(prices, precision="fp32")
 
@@ -61,11 +97,13 @@ def test_arbitrage_detection():
         print(f"   Save {best.percentage_savings:.1f}% by using {best.cheapest['provider']}")
     else:
         print("❌ No best arbitrage found")
-        return False
+        return False, opportunities
 
-    # Test 3: Get arbitrage for specific GPU
+    # Test 3: Get arbitrage for specific GPU via the shared per-model
+    # index — detection runs on just the A100 rows
     print("\n[Test 3] Get arbitrage for specific GPU (A100)")
-    a100_arb = detector.get_arbitrage_by_gpu(prices, "A100", precision="fp32")
+    by_gpu, _ = _cached_indexes()
+    a100_arb = detector.get_arbitrage_by_gpu(prices, "A100", precision="fp32", index=by_gpu)
 
     if a100_arb:
         print(f"✅ A100 arbitrage opportunity:")
@@ -76,7 +114,7 @@ def test_arbitrage_detection():
         print("⚠️  No A100 arbitrage found (this is OK if <2 providers)")
 
     print("\n✅ Arbitrage detection tests passed!")
-    return True
+    return True, opportunities
 
 
 def test_savings_calculation():
@@ -85,13 +123,10 @@ def test_savings_calculation():
     print("TESTING SAVINGS CALCULATIONS")
     print("="*70 + "\n")
 
-    # Get prices and opportunities
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    # Get prices and opportunities (shared fetch)
+    prices = _cached_result()['prices']
 
-    detector = ArbitrageDetector()
-    opportunities = detector.detect_opportunities(prices, precision="fp32")
+    opportunities = _DETECTOR.detect_opportunities(prices, precision="fp32")
 
     if not opportunities:
         print("⚠️  No opportunities to test savings calculation")
@@ -128,14 +163,13 @@ def test_cross_region_arbitrage():
     print("TESTING CROSS-REGION ARBITRAGE")
     print("="*70 + "\n")
 
-    # Get prices
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
+    # Get prices and shared (provider, model) index
+    prices = _cached_result()['prices']
+    _, by_provider_gpu = _cached_indexes()
 
     # Test AWS cross-region for A100
     print("[Test 1] Find AWS cross-region arbitrage for A100")
-    aws_arbitrage = find_cross_region_arbitrage(prices, "AWS", "A100")
+    aws_arbitrage = find_cross_region_arbitrage(prices, "AWS", "A100", index=by_provider_gpu)
 
     if aws_arbitrage:
         print(f"✅ AWS regional arbitrage found:")
@@ -149,7 +183,7 @@ def test_cross_region_arbitrage():
 
     # Test GCP cross-region
     print("\n[Test 2] Find GCP cross-region arbitrage for A100")
-    gcp_arbitrage = find_cross_region_arbitrage(prices, "GCP", "A100")
+    gcp_arbitrage = find_cross_region_arbitrage(prices, "GCP", "A100", index=by_provider_gpu)
 
     if gcp_arbitrage:
         print(f"✅ GCP regional arbitrage found:")
@@ -166,15 +200,22 @@ def test_deterministic_results():
     print("TESTING DETERMINISTIC RESULTS")
     print("="*70 + "\n")
 
-    # Get prices
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
-
-    # Detect twice
-    detector = ArbitrageDetector()
-    opps1 = detector.detect_opportunities(prices.copy(), precision="fp32")
-    opps2 = detector.detect_opportunities(prices.copy(), precision="fp32")
+    # Get prices (shared fetch)
+    prices = _cached_result()['prices']
+
+    # Detect twice over the same list — no defensive copies; detection
+    # must not reorder its input. The detector cache is invalidated
+    # between calls so the second run is a genuine recompute rather
+    # than a snapshot-cache hit
+    detector = _DETECTOR
+    snapshot = [id(p) for p in prices]
+    opps1 = detector.detect_opportunities(prices, precision="fp32")
+    detector.invalidate_cache()
+    opps2 = detector.detect_opportunities(prices, precision="fp32")
+
+    if [id(p) for p in prices] != snapshot:
+        print("❌ Detection mutated the input list")
+        return False
 
     # Compare
     if len(opps1) != len(opps2):
@@ -195,17 +236,56 @@ def test_deterministic_results():
     return True
 
 
+def test_numba_branch_parity():
+    """Test the numba-shaped detection branch against the pandas one.
+
+    numba may not be installed here, but the kernel branch in _detect is
+    plain Python until njit wraps it, so forcing _HAVE_NUMBA exercises
+    the exact code path an accelerated build runs — the two branches
+    must produce identical opportunities and must not drift apart.
+    """
+    print("\n" + "="*70)
+    print("TESTING NUMBA BRANCH PARITY")
+    print("="*70 + "\n")
+
+    prices = _cached_result()['prices']
+
+    print("[Test 1] Forced-numba detection matches pandas detection")
+    baseline = ArbitrageDetector().detect_opportunities(prices, precision="fp32")
+
+    saved = arbitrage_module._HAVE_NUMBA
+    arbitrage_module._HAVE_NUMBA = True
+    try:
+        forced = ArbitrageDetector().detect_opportunities(prices, precision="fp32")
+    finally:
+        arbitrage_module._HAVE_NUMBA = saved
+
+    if len(forced) != len(baseline):
+        print(f"❌ Branch mismatch: {len(forced)} vs {len(baseline)} opportunities")
+        return False
+
+    for idx, (f, b) in enumerate(zip(forced, baseline)):
+        if f.gpu_model != b.gpu_model or abs(f.percentage_savings - b.percentage_savings) > 0.01:
+            print(f"❌ Branches disagree at position {idx}: {f.gpu_model} vs {b.gpu_model}")
+            return False
+
+    print(f"✅ Both branches agree across {len(baseline)} opportunities")
+    return True
+
+
 def main():
     """Run all arbitrage detection tests."""
     print("\n" + "="*70)
     print("STEP 5 VALIDATION: ARBITRAGE DETECTION ENGINE")
     print("="*70)
 
+    detection_passed, opportunities = test_arbitrage_detection()
     results = {
-        'Arbitrage Detection': test_arbitrage_detection(),
+        'Arbitrage Detection': detection_passed,
         'Savings Calculation': test_savings_calculation(),
         'Cross-Region Arbitrage': test_cross_region_arbitrage(),
         'Deterministic Results': test_deterministic_results(),
+        'Numba Branch Parity': test_numba_branch_parity(),
     }
 
     # Summary
@@ -213,7 +293,8 @@ def main():
     print("VALIDATION SUMMARY")
     print("="*70 + "\n")
 
-    passed = sum(1 for r in results.values() if r)
+    # bool is int: True sums as 1, no generator filter needed
+    passed = sum(results.values())
     total = len(results)
 
     for name, result in results.items():
@@ -222,19 +303,14 @@ def main():
 
     print(f"\nResult: {passed}/{total} tests passed")
 
-    # Print full arbitrage report
-    print("\n" + "="*70)
-    print("FULL ARBITRAGE REPORT")
-    print("="*70)
-
-    scheduler = PricingScheduler()
-    result = scheduler.fetch_all_prices(parallel=True)
-    prices = result['prices']
-
-    detector = ArbitrageDetector()
-    opportunities = detector.detect_opportunities(prices, precision="fp32")
-
-    print_arbitrage_report(opportunities)
+    # Print full arbitrage report from the opportunities already
+    # computed in the detection test — no extra fetch or analytics
+    # pass, and no report at all on a failing run
+    if passed == total:
+        print("\n" + "="*70)
+        print("FULL ARBITRAGE REPORT")
+        print("="*70)
+        print_arbitrage_report(opportunities)
 
     if passed == total:
         print("\n🎉 STEP 5 COMPLETE! Arbitrage engine validated successfully.\n")